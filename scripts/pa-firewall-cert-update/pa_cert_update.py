@@ -17,17 +17,29 @@ Phase 1 Implementation (Current):
 """
 
 import argparse
+import atexit
+import gzip
+import io
 import sys
 import os
 import logging
+import queue
+import threading
+import time
 import traceback
 import urllib3
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import BinaryIO, List, Dict, Optional, Tuple, Union
+from xml.sax.saxutils import escape
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.filepost import choose_boundary, encode_multipart_formdata
     from lxml import etree
 except ImportError as e:
     print(f"ERROR: Missing required package: {e}")
@@ -41,15 +53,208 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 API_ENDPOINT = "/api/"
 DEFAULT_BACKUP_DIR = "./backups"
 DEFAULT_LOG_DIR = "./logs"
+STREAM_CHUNK_SIZE = 1 << 20  # 1 MiB chunks when streaming backups to disk
+SUCCESS_SENTINEL = b'<response status="success"'  # Leading bytes of a plain success response
+
+# Console/log section separators
+BANNER = "=" * 80
+SUBBANNER = "-" * 80
+
+# Device and virtual system holding the GlobalProtect configuration
+DEVICE_NAME = "localhost.localdomain"
+VSYS_NAME = "vsys1"
+VSYS_XPATH = f"/config/devices/entry[@name='{DEVICE_NAME}']/vsys/entry[@name='{VSYS_NAME}']"
+
+# Config containers whose <entry> children can reference a certificate,
+# mapped to the usage bucket they are reported under
+CERT_USAGE_CONTAINERS = {
+    'ssl-tls-service-profile': 'ssl_tls_profiles',
+    'global-protect-portal': 'portals',
+    'global-protect-gateway': 'gateways',
+    'management': 'other'
+}
+
+# Rulebase sections that never reference a certificate by name - they hold the
+# bulk of most configs, so the usage scan skips them. Decryption rules are still
+# scanned since ssl-inbound-inspection names the server certificate directly.
+RULEBASES_WITHOUT_CERT_REFS = frozenset({
+    'security',
+    'nat',
+    'qos',
+    'pbf',
+    'application-override',
+    'authentication',
+    'dos',
+    'tunnel-inspect',
+    'sdwan',
+    'network-packet-broker'
+})
+
+# iterparse options for configuration content (backups and config subtrees) -
+# drops whitespace/comment nodes, skips the ID table, never expands entities or
+# touches the network, and lifts libxml2's size limits for very large configs
+_CONFIG_PARSE_OPTIONS = {
+    'huge_tree': True,
+    'remove_blank_text': True,
+    'remove_comments': True,
+    'collect_ids': False,
+    'resolve_entities': False,
+    'no_network': True
+}
+
+# Per-thread parser storage - lxml parsers must not be shared between threads
+_parser_local = threading.local()
+
+# Precompiled XPath expressions - names are bound as $n variables rather than
+# spliced into the expression, so lxml compiles each one only once per process
+_XP_REFERENCE_OWNER = etree.XPath(
+    "ancestor::entry[parent::ssl-tls-service-profile or parent::global-protect-portal"
+    " or parent::global-protect-gateway or parent::management]"
+)
+_XP_ENTRY_BY_NAME = etree.XPath("//entry[@name=$n]")
+_XP_IN_USAGE_CONTAINER = etree.XPath(
+    "boolean(" + " or ".join(f"ancestor-or-self::{tag}" for tag in CERT_USAGE_CONTAINERS) + ")"
+)
+
+# Error fields of an API response, returned as plain strings ('' when absent)
+_XP_MSG = etree.XPath("string(.//msg)", smart_strings=False)
+_XP_LINE = etree.XPath("string(.//line)", smart_strings=False)
+_XP_DETAILS = etree.XPath("string(.//details/line)", smart_strings=False)
+
+# Certificate entry child elements reported by list_certificates
+CERT_INFO_FIELDS = {
+    'common-name': 'common_name',
+    'issuer': 'issuer',
+    'not-valid-after': 'expiry'
+}
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
+def _xml_parser() -> etree.XMLParser:
+    """
+    Return the calling thread's parser for API responses.
+
+    The parser drops whitespace/comment nodes, skips the ID table and never
+    expands entities (no XXE from a tampered response).
+
+    Returns:
+        XMLParser instance owned by the current thread
+    """
+    parser = getattr(_parser_local, 'parser', None)
+    if parser is None:
+        parser = _parser_local.parser = etree.XMLParser(
+            huge_tree=False,
+            remove_blank_text=True,
+            remove_comments=True,
+            collect_ids=False,
+            resolve_entities=False
+        )
+    return parser
+
+
+def xpath_literal(value: str) -> str:
+    """
+    Quote a name for use as a string literal in an API xpath parameter.
+
+    XPath 1.0 literals cannot escape quotes, so the quote character not
+    present in the value is used.
+
+    Args:
+        value: Raw name (certificate, profile, portal or gateway)
+
+    Returns:
+        Name wrapped in single or double quotes
+
+    Raises:
+        ValueError: If the name contains both quote characters
+    """
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    raise ValueError(f"Name contains both single and double quotes: {value}")
+
+
+class _ConcatenatedStream(io.RawIOBase):
+    """
+    Read-only stream over a sequence of byte strings and binary files.
+
+    Lets a request body be sent straight from disk while still reporting its
+    total length (so no chunked encoding is needed) and supporting the rewinds
+    urllib3 performs when it retries a request.
+    """
+
+    def __init__(self, parts: List[Union[bytes, BinaryIO]]):
+        """
+        Initialize the stream.
+
+        Args:
+            parts: Byte strings and seekable binary files, in body order
+        """
+        super().__init__()
+        self._parts = []
+        for part in parts:
+            if isinstance(part, bytes):
+                part = io.BytesIO(part)
+            size = part.seek(0, io.SEEK_END)
+            part.seek(0)
+            self._parts.append((part, size))
+        self._length = sum(size for _, size in self._parts)
+        self._pos = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self._length
+        self._pos = max(0, min(offset, self._length))
+        return self._pos
+
+    def readinto(self, buffer) -> int:
+        # Serve the read from whichever part holds the current position
+        start = 0
+        for part, size in self._parts:
+            if self._pos < start + size:
+                part.seek(self._pos - start)
+                count = part.readinto(memoryview(buffer)[:start + size - self._pos])
+                self._pos += count
+                return count
+            start += size
+        return 0
+
+
 class PAFirewallClient:
     """Client for interacting with Palo Alto Firewall XML API."""
 
-    def __init__(self, firewall: str, api_key: str, verify_ssl: bool = False):
+    # Request timeouts in seconds (device state export can take minutes)
+    DEFAULT_TIMEOUT = 30
+    DEVICE_STATE_TIMEOUT = 300
+
+    # Seconds a cached read-only config response stays valid
+    CACHE_TTL = 10
+
+    # Seconds a verify_certificate_exists() result stays valid
+    CERT_EXISTS_TTL = 30
+
+    # Concurrent per-entry updates when a batched set has to fall back
+    UPDATE_WORKERS = 8
+
+    def __init__(self, firewall: str, api_key: str, verify_ssl: bool = False,
+                 compress_uploads: bool = False):
         """
         Initialize firewall client.
 
@@ -57,12 +262,45 @@ class PAFirewallClient:
             firewall: Firewall hostname or IP address
             api_key: PAN-OS API key
             verify_ssl: Whether to verify SSL certificates (default: False)
+            compress_uploads: Gzip-encode certificate uploads (default: False)
         """
         self.firewall = firewall
         self.api_key = api_key
         self.verify_ssl = verify_ssl
+        self.compress_uploads = compress_uploads
         self.base_url = f"https://{firewall}{API_ENDPOINT}"
+
+        # Single pooled session so every call reuses the same keep-alive
+        # connection instead of renegotiating TLS with the firewall
         self.session = requests.Session()
+        self.session.verify = verify_ssl
+        # Authenticate via header so the key never appears in request URLs
+        self.session.headers['X-PAN-KEY'] = api_key
+        # Never retry a read timeout: the request reached the firewall, and
+        # re-sending a slow export just queues another job on a busy box.
+        # Status retries are limited to GET and to responses where the
+        # request was not carried out - a POST import or a 500 may already
+        # have changed the config, so those are reported, not re-sent
+        retry = urllib3.util.Retry(
+            total=3,
+            read=0,
+            backoff_factor=0.5,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=['GET'],
+            raise_on_status=False
+        )
+        self.session.mount(f"https://{firewall}/", HTTPAdapter(pool_maxsize=20, max_retries=retry))
+
+        # Parsed config GET results keyed by (type, action, xpath). Derived
+        # results use a first component that is not an API type, so they can
+        # never be returned where a raw response element is expected
+        self._cache: Dict[Tuple[str, str, str], Tuple[float, object]] = {}
+
+        # Certificate usage scans keyed by (config file, mtime, cert name)
+        self._usage_cache: Dict[Tuple[str, int, str], Dict[str, List[str]]] = {}
+
+        # verify_certificate_exists() results keyed by certificate name
+        self._cert_exists_cache: Dict[str, Tuple[float, bool]] = {}
 
         # Sanitize API key for logging (show only first/last 4 chars)
         self.api_key_display = f"{api_key[:4]}...{api_key[-4:]}" if len(api_key) > 8 else "****"
@@ -70,14 +308,22 @@ class PAFirewallClient:
         logger.info(f"Initialized client for firewall: {firewall}")
         logger.debug(f"API key: {self.api_key_display}")
 
-    def _api_call(self, params: Dict, method: str = 'GET', files: Dict = None) -> requests.Response:
+    def _api_call(self, params: Dict, method: str = 'GET', files: Dict = None,
+                  data: Union[Dict, bytes] = None, headers: Dict = None, timeout: Optional[int] = None,
+                  stream_to: Optional[BinaryIO] = None, stream: bool = False) -> requests.Response:
         """
         Make API call to firewall.
 
         Args:
-            params: Query parameters for API call
+            params: Query parameters for API call (API key is added by the session)
             method: HTTP method (GET or POST)
             files: Files to upload (for POST requests)
+            data: Form fields or raw body sent in the request (for POST requests)
+            headers: Extra request headers (for POST requests)
+            timeout: Request timeout in seconds (default: DEFAULT_TIMEOUT)
+            stream_to: Optional binary file to stream the response body into
+                       (the body is then not available on the response)
+            stream: Leave the body unread so the caller can consume response.raw
 
         Returns:
             Response object
@@ -85,29 +331,35 @@ class PAFirewallClient:
         Raises:
             requests.exceptions.RequestException: On connection or HTTP errors
         """
-        # Add API key to params
-        params['key'] = self.api_key
+        if timeout is None:
+            timeout = self.DEFAULT_TIMEOUT
+
+        # Anything that may change the candidate config invalidates cached reads
+        if params.get('type') == 'import' or params.get('action') not in (None, 'get', 'show'):
+            self._cache.clear()
 
-        # Log API call (sanitize sensitive data)
-        log_params = params.copy()
-        log_params['key'] = self.api_key_display
-        logger.debug(f"API call: {method} {self.base_url} params={log_params}")
+        # Log API call (API key lives on the session, so params are safe to log)
+        logger.debug(f"API call: {method} {self.base_url} params={params}")
+
+        stream = stream or stream_to is not None
 
         try:
             if method == 'GET':
                 response = self.session.get(
                     self.base_url,
                     params=params,
-                    verify=self.verify_ssl,
-                    timeout=30
+                    timeout=timeout,
+                    stream=stream
                 )
             elif method == 'POST':
                 response = self.session.post(
                     self.base_url,
                     params=params,
                     files=files,
-                    verify=self.verify_ssl,
-                    timeout=30
+                    data=data,
+                    headers=headers,
+                    timeout=timeout,
+                    stream=stream
                 )
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
@@ -115,6 +367,13 @@ class PAFirewallClient:
             response.raise_for_status()
             logger.debug(f"API response: {response.status_code}")
 
+            if stream_to is not None:
+                # Write the body to disk chunk by chunk rather than holding
+                # the whole export in memory via response.content
+                with response:
+                    for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                        stream_to.write(chunk)
+
             return response
 
         except requests.exceptions.ConnectionError as e:
@@ -129,6 +388,147 @@ class PAFirewallClient:
             logger.error(f"Response: {e.response.text[:200]}")
             raise
 
+    def _api_call_status_only(self, params: Dict) -> Tuple[bool, requests.Response]:
+        """
+        Make an API call whose response body only matters when it is an error.
+
+        Successful set/edit responses are recognised by their leading
+        SUCCESS_SENTINEL bytes, so the common case never builds an lxml tree.
+
+        Args:
+            params: Query parameters for API call
+
+        Returns:
+            Tuple of (succeeded, response) - callers only need to parse the
+            response when succeeded is False
+        """
+        response = self._api_call(params)
+        return response.content[:64].lstrip().startswith(SUCCESS_SENTINEL), response
+
+    def _cache_get(self, key: Tuple[str, str, str]) -> Optional[object]:
+        """
+        Return a cached config GET result if it is younger than CACHE_TTL.
+
+        Args:
+            key: (type, action, xpath) of the request
+
+        Returns:
+            Cached result, or None if missing or expired
+        """
+        cached = self._cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.CACHE_TTL:
+            logger.debug(f"Using cached response for xpath={key[2]}")
+            return cached[1]
+        return None
+
+    def _cache_put(self, key: Tuple[str, str, str], value: object):
+        """
+        Cache a config GET result.
+
+        Args:
+            key: (type, action, xpath) of the request
+            value: Parsed result to cache
+        """
+        self._cache[key] = (time.monotonic(), value)
+
+    def _api_get_xml(self, params: Dict, use_cache: bool = True) -> etree._Element:
+        """
+        Make a read-only config API call and return the parsed XML response.
+
+        Identical (type, action, xpath) requests made within CACHE_TTL seconds
+        are served from cache instead of fetching and parsing them again.
+
+        Args:
+            params: Query parameters for API call
+            use_cache: Whether a cached response may be returned
+
+        Returns:
+            Root element of the parsed response
+        """
+        key = (params.get('type'), params.get('action'), params.get('xpath'))
+
+        if use_cache:
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+
+        # Feed the body straight into libxml2 rather than materialising
+        # response.content first - config subtrees can be large
+        response = self._api_call(params, stream=True)
+        with response:
+            response.raw.decode_content = True
+            root = etree.parse(response.raw, _xml_parser()).getroot()
+
+        # Only successful responses are worth reusing
+        if root.get('status') == 'success':
+            self._cache_put(key, root)
+
+        return root
+
+    def _upload_pem(self, params: Dict, filename: str, content: Union[BinaryIO, bytes]) -> etree._Element:
+        """
+        Upload a PEM file to the import API and return the parsed response.
+
+        The multipart body is streamed from content rather than assembled in
+        memory. When compress_uploads is set the body is instead sent
+        gzip-encoded; if the firewall rejects the encoding (HTTP 400/415, a
+        response that is not XML, or an error message about the encoding), the
+        upload is retried uncompressed and compression is turned off for the
+        rest of the session. Any other import error is returned as is.
+
+        Args:
+            params: Query parameters for the import call
+            filename: File name reported in the multipart form
+            content: PEM data as bytes or a seekable binary file object
+
+        Returns:
+            Root element of the parsed response
+        """
+        if self.compress_uploads:
+            pem = content.read() if hasattr(content, 'read') else content
+            body, content_type = encode_multipart_formdata({
+                'file': (filename, pem, 'application/x-pem-file')
+            })
+            headers = {'Content-Type': content_type, 'Content-Encoding': 'gzip'}
+
+            try:
+                response = self._api_call(params, method='POST', headers=headers,
+                                          data=gzip.compress(body, compresslevel=6))
+            except requests.exceptions.HTTPError as e:
+                # Only a rejected request body points at the encoding
+                if e.response is None or e.response.status_code not in (400, 415):
+                    raise
+            else:
+                try:
+                    root = etree.fromstring(response.content, _xml_parser())
+                except etree.XMLSyntaxError:
+                    root = None
+
+                if root is not None:
+                    msg = _XP_MSG(root).lower()
+                    if root.get('status') == 'success' or not ('encoding' in msg or 'gzip' in msg):
+                        # Success, or a real import error (bad PEM, passphrase...)
+                        return root
+
+            logger.warning("⚠ Compressed upload not accepted - retrying uncompressed")
+            self.compress_uploads = False
+            content = pem
+
+        # Multipart envelope around the PEM data, which is read from content
+        # only as the request is sent
+        boundary = choose_boundary()
+        head = (
+            f'--{boundary}\r\n'
+            f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+            f'Content-Type: application/x-pem-file\r\n\r\n'
+        ).encode()
+        tail = f'\r\n--{boundary}--\r\n'.encode()
+        headers = {'Content-Type': f'multipart/form-data; boundary={boundary}'}
+
+        body = _ConcatenatedStream([head, content, tail])
+        response = self._api_call(params, method='POST', data=body, headers=headers)
+        return etree.fromstring(response.content, _xml_parser())
+
     def test_connection(self) -> bool:
         """
         Test API connection and authentication.
@@ -146,7 +546,7 @@ class PAFirewallClient:
             response = self._api_call(params)
 
             # Parse XML response
-            root = etree.fromstring(response.content)
+            root = etree.fromstring(response.content, _xml_parser())
             status = root.get('status')
 
             if status == 'success':
@@ -168,12 +568,12 @@ class PAFirewallClient:
             logger.error(f"✗ Connection test failed: {e}")
             return False
 
-    def backup_configuration(self, backup_dir: str, timestamp: str = None) -> Optional[str]:
+    def backup_configuration(self, backup_dir: Path, timestamp: str = None) -> Optional[str]:
         """
         Backup firewall configuration to XML file.
 
         Args:
-            backup_dir: Directory to save backup file
+            backup_dir: Existing directory to save backup file
             timestamp: Optional timestamp string (generated if not provided)
 
         Returns:
@@ -181,25 +581,24 @@ class PAFirewallClient:
         """
         logger.info("Backing up firewall configuration...")
 
-        # Create backup directory if it doesn't exist
-        Path(backup_dir).mkdir(parents=True, exist_ok=True)
-
         # Generate timestamp if not provided
         if not timestamp:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
 
-        backup_file = Path(backup_dir) / f"{self.firewall}-config-{timestamp}.xml"
+        backup_file = backup_dir / f"{self.firewall}-config-{timestamp}.xml"
+        # Stream into a .part file so a failed export never leaves a
+        # truncated file under the final backup name
+        part_file = backup_file.with_suffix(backup_file.suffix + '.part')
 
         try:
             params = {
                 'type': 'export',
                 'category': 'configuration'
             }
-            response = self._api_call(params)
-
-            # Save configuration to file
-            with open(backup_file, 'wb') as f:
-                f.write(response.content)
+            # Stream configuration straight to file
+            with open(part_file, 'wb', buffering=STREAM_CHUNK_SIZE) as f:
+                self._api_call(params, stream_to=f)
+            os.replace(part_file, backup_file)
 
             # Get file size for logging
             file_size = backup_file.stat().st_size
@@ -210,16 +609,17 @@ class PAFirewallClient:
             return str(backup_file)
 
         except Exception as e:
+            part_file.unlink(missing_ok=True)
             logger.error(f"✗ Configuration backup failed: {e}")
             return None
 
-    def backup_device_state(self, backup_dir: str, timestamp: str = None) -> Optional[str]:
+    def backup_device_state(self, backup_dir: Path, timestamp: str = None) -> Optional[str]:
         """
         Backup complete device state (more comprehensive than config only).
         Device state includes running config, logs, and system state information.
 
         Args:
-            backup_dir: Directory to save backup file
+            backup_dir: Existing directory to save backup file
             timestamp: Optional timestamp string (generated if not provided)
 
         Returns:
@@ -227,14 +627,14 @@ class PAFirewallClient:
         """
         logger.info("Backing up device state (this may take a few minutes)...")
 
-        # Create backup directory if it doesn't exist
-        Path(backup_dir).mkdir(parents=True, exist_ok=True)
-
         # Generate timestamp if not provided
         if not timestamp:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
 
-        backup_file = Path(backup_dir) / f"{self.firewall}-device-state-{timestamp}.tgz"
+        backup_file = backup_dir / f"{self.firewall}-device-state-{timestamp}.tgz"
+        # Stream into a .part file so a failed export never leaves a
+        # truncated archive under the final backup name
+        part_file = backup_file.with_suffix(backup_file.suffix + '.part')
 
         try:
             params = {
@@ -242,17 +642,9 @@ class PAFirewallClient:
                 'category': 'device-state'
             }
             # Device state export can take longer - increase timeout
-            response = self.session.get(
-                self.base_url,
-                params={**params, 'key': self.api_key},
-                verify=self.verify_ssl,
-                timeout=300  # 5 minutes
-            )
-            response.raise_for_status()
-
-            # Save device state to file
-            with open(backup_file, 'wb') as f:
-                f.write(response.content)
+            with open(part_file, 'wb', buffering=STREAM_CHUNK_SIZE) as f:
+                self._api_call(params, timeout=self.DEVICE_STATE_TIMEOUT, stream_to=f)
+            os.replace(part_file, backup_file)
 
             # Get file size for logging
             file_size = backup_file.stat().st_size
@@ -263,9 +655,11 @@ class PAFirewallClient:
             return str(backup_file)
 
         except requests.exceptions.Timeout:
+            part_file.unlink(missing_ok=True)
             logger.error(f"✗ Device state backup timed out (firewall may be busy)")
             return None
         except Exception as e:
+            part_file.unlink(missing_ok=True)
             logger.error(f"✗ Device state backup failed: {e}")
             return None
 
@@ -279,11 +673,13 @@ class PAFirewallClient:
         Returns:
             Dictionary with paths to backup files {'config': path, 'device_state': path}
         """
-        logger.info("\n" + "="*80)
+        logger.info("\n" + BANNER)
         logger.info("FULL FIREWALL BACKUP")
-        logger.info("="*80)
+        logger.info(BANNER)
 
-        # Use same timestamp for both backups
+        # Create backup directory once and use same timestamp for both backups
+        backup_dir = Path(backup_dir)
+        backup_dir.mkdir(parents=True, exist_ok=True)
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
 
         backups = {
@@ -291,25 +687,30 @@ class PAFirewallClient:
             'device_state': None
         }
 
+        # Both exports are independent waits on the firewall - run them
+        # concurrently over the pooled session
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            config_future = executor.submit(self.backup_configuration, backup_dir, timestamp)
+            device_state_future = executor.submit(self.backup_device_state, backup_dir, timestamp)
+            config_backup = config_future.result()
+            device_state_backup = device_state_future.result()
+
         # Backup configuration
-        config_backup = self.backup_configuration(backup_dir, timestamp)
         if config_backup:
             backups['config'] = config_backup
         else:
             logger.warning("Configuration backup failed - proceeding with caution")
 
         # Backup device state
-        logger.info("")  # Blank line for readability
-        device_state_backup = self.backup_device_state(backup_dir, timestamp)
         if device_state_backup:
             backups['device_state'] = device_state_backup
         else:
             logger.warning("Device state backup failed - config backup still available")
 
         # Summary
-        logger.info("\n" + "-"*80)
+        logger.info("\n" + SUBBANNER)
         logger.info("BACKUP SUMMARY")
-        logger.info("-"*80)
+        logger.info(SUBBANNER)
         if backups['config']:
             logger.info(f"✓ Configuration: {backups['config']}")
         else:
@@ -320,7 +721,7 @@ class PAFirewallClient:
         else:
             logger.warning(f"⚠ Device State: FAILED (non-critical)")
 
-        logger.info("="*80 + "\n")
+        logger.info(BANNER + "\n")
 
         return backups
 
@@ -339,42 +740,207 @@ class PAFirewallClient:
                 'action': 'get',
                 'xpath': '/config/shared/certificate'
             }
-            response = self._api_call(params)
-
-            # Parse XML response
-            root = etree.fromstring(response.content)
-            status = root.get('status')
+            # Holds the parsed list, not a response element - keep it apart
+            # from _api_get_xml() entries for the same xpath
+            key = ('certificate-list', params['action'], params['xpath'])
 
-            if status != 'success':
-                logger.error("Failed to retrieve certificates")
-                return []
+            certificates = self._cache_get(key)
+            if certificates is not None:
+                logger.info(f"✓ Found {len(certificates)} certificate(s)")
+                return list(certificates)
 
-            # Extract certificate entries
+            status = None
             certificates = []
-            cert_entries = root.xpath('.//entry')
+            response = self._api_call(params, stream=True)
+
+            with response:
+                # Parse incrementally, keeping only the fields shown to the user -
+                # each entry's PEM key material is discarded as soon as it is read
+                response.raw.decode_content = True
+                context = etree.iterparse(
+                    response.raw,
+                    events=('start', 'end'),
+                    tag=('response', 'entry'),
+                    **_CONFIG_PARSE_OPTIONS
+                )
+
+                for event, elem in context:
+                    if event == 'start':
+                        if elem.tag == 'response':
+                            status = elem.get('status')
+                        continue
+
+                    parent = elem.getparent()
+                    if parent is None or parent.tag != 'certificate':
+                        continue
 
-            for entry in cert_entries:
-                cert_name = entry.get('name')
+                    cert_info = {
+                        'name': elem.get('name'),
+                        'common_name': 'N/A',
+                        'issuer': 'N/A',
+                        'expiry': 'N/A'
+                    }
 
-                # Extract additional info if available
-                common_name = entry.findtext('.//common-name', default='N/A')
-                issuer = entry.findtext('.//issuer', default='N/A')
-                not_valid_after = entry.findtext('.//not-valid-after', default='N/A')
+                    # Fill in additional info from the entry's children in one pass
+                    for child in elem:
+                        field = CERT_INFO_FIELDS.get(child.tag)
+                        if field:
+                            cert_info[field] = child.text or 'N/A'
+
+                    certificates.append(cert_info)
+
+                    elem.clear()
+                    while elem.getprevious() is not None:
+                        del parent[0]
+
+                del context
+
+            if status != 'success':
+                logger.error("Failed to retrieve certificates")
+                return []
 
-                certificates.append({
-                    'name': cert_name,
-                    'common_name': common_name,
-                    'issuer': issuer,
-                    'expiry': not_valid_after
-                })
+            self._cache_put(key, certificates)
 
             logger.info(f"✓ Found {len(certificates)} certificate(s)")
-            return certificates
+            return list(certificates)
 
         except Exception as e:
             logger.error(f"✗ Failed to retrieve certificates: {e}")
             return []
 
+    def _record_certificate_reference(self, elem, cert_name: str, usage: Dict[str, List[str]],
+                                      in_certificate: bool = False):
+        """
+        Classify a configuration element whose text matches the certificate name.
+
+        Args:
+            elem: Element whose text equals cert_name
+            cert_name: Name of certificate being searched for
+            usage: Usage buckets to record the reference in
+            in_certificate: Whether elem sits under a <certificate> element
+
+        Returns:
+            True if elem is a generic reference the caller should report
+            under 'other', False otherwise
+        """
+        # References owned by an SSL/TLS profile, portal, gateway or management entry
+        if elem.tag in ('certificate', 'ssl-tls-service-profile'):
+            # Ancestors come back in document order - check the nearest first
+            for entry in reversed(_XP_REFERENCE_OWNER(elem)):
+                container = entry.getparent()
+                bucket = CERT_USAGE_CONTAINERS[container.tag]
+                is_child = elem.getparent() is entry
+                if container.tag == 'ssl-tls-service-profile':
+                    matched = elem.tag == 'certificate' and is_child
+                elif container.tag == 'management':
+                    matched = elem.tag == 'certificate'
+                else:
+                    matched = elem.tag == 'certificate' or is_child
+
+                if matched:
+                    name = entry.get('name')
+                    if container.tag == 'management':
+                        name = f"Management Interface: {name}"
+                    if name not in usage[bucket]:
+                        usage[bucket].append(name)
+                    return False
+
+        # Generic reference - skip the certificate definitions themselves and
+        # anything under the containers handled above
+        if in_certificate:
+            return False
+
+        return not _XP_IN_USAGE_CONTAINER(elem)
+
+    def _scan_certificate_usage(self, config_file: str, cert_name: str) -> Dict[str, List[str]]:
+        """
+        Scan a configuration file for references to a certificate.
+
+        Args:
+            config_file: Path to configuration XML file
+            cert_name: Name of certificate to search for
+
+        Returns:
+            Dictionary with usage locations
+        """
+        usage = {
+            'ssl_tls_profiles': [],
+            'portals': [],
+            'gateways': [],
+            'other': []
+        }
+
+        # Stream the configuration in a single pass instead of building the
+        # full DOM and sweeping it once per query - backups can be many MB
+        with open(config_file, 'rb') as f:
+            context = etree.iterparse(f, events=('start', 'end'), **_CONFIG_PARSE_OPTIONS)
+            cert_depth = 0
+            skipped = None
+
+            # Position of each open element as (tag, index, parent's per-tag
+            # child counts, own per-tag child counts). Released entries are
+            # pruned from the tree, so getpath() would shift indices; and the
+            # counts only become final once later siblings are parsed, so
+            # generic references are rendered after the scan
+            path = []
+            other_refs = []
+
+            for event, elem in context:
+                if event == 'start':
+                    siblings = path[-1][3] if path else {}
+                    index = siblings.get(elem.tag, 0) + 1
+                    siblings[elem.tag] = index
+                    path.append((elem.tag, index, siblings, {}))
+
+                    if skipped is not None:
+                        continue
+
+                    # Track nesting inside <certificate> so generic matches can
+                    # skip certificate definitions without walking ancestors
+                    if elem.tag == 'certificate':
+                        cert_depth += 1
+                    elif elem.tag in RULEBASES_WITHOUT_CERT_REFS:
+                        parent = elem.getparent()
+                        if parent is not None and parent.tag == 'rulebase':
+                            skipped = elem
+                    continue
+
+                if skipped is not None:
+                    # Inside a skipped rulebase section - only release memory
+                    if elem is skipped:
+                        elem.clear(keep_tail=True)
+                        skipped = None
+                else:
+                    if elem.tag == 'certificate':
+                        cert_depth -= 1
+
+                    if (elem.text == cert_name and
+                            self._record_certificate_reference(elem, cert_name, usage, cert_depth > 0)):
+                        other_refs.append([(tag, index, siblings) for tag, index, siblings, _ in path])
+
+                if elem.tag == 'entry':
+                    # Entry fully processed - release it and its siblings
+                    elem.clear(keep_tail=True)
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
+
+                path.pop()
+
+            del context
+
+        for components in other_refs:
+            # Same form as getpath(): index only when the tag repeats among siblings
+            xpath = '/' + '/'.join(
+                f"{tag}[{index}]" if siblings[tag] > 1 else tag
+                for tag, index, siblings in components
+            )
+
+            # Simplify XPath for readability
+            parts = xpath.split('/')
+            usage['other'].append('/'.join(parts[-3:]) if len(parts) > 3 else xpath)
+
+        return usage
+
     def search_certificate_usage(self, config_file: str, cert_name: str) -> Dict[str, List[str]]:
         """
         Search configuration for all references to a certificate.
@@ -386,9 +952,9 @@ class PAFirewallClient:
         Returns:
             Dictionary with usage locations
         """
-        logger.info("\n" + "="*80)
+        logger.info("\n" + BANNER)
         logger.info("CERTIFICATE USAGE ANALYSIS")
-        logger.info("="*80)
+        logger.info(BANNER)
         logger.info(f"Searching for: {cert_name}")
         logger.info(f"Config file: {config_file}")
         logger.info("")
@@ -401,75 +967,57 @@ class PAFirewallClient:
         }
 
         try:
-            # Parse configuration XML
-            tree = etree.parse(config_file)
-            root = tree.getroot()
-
-            # Search for SSL/TLS service profiles
-            ssl_profiles = root.xpath(f"//ssl-tls-service-profile/entry[certificate='{cert_name}']/@name")
-            usage['ssl_tls_profiles'] = list(ssl_profiles)
-
-            # Search for GlobalProtect portals
-            portals = root.xpath(f"//global-protect/global-protect-portal/entry[ssl-tls-service-profile='{cert_name}' or .//certificate='{cert_name}']/@name")
-            usage['portals'] = list(portals)
-
-            # Search for GlobalProtect gateways
-            gateways = root.xpath(f"//global-protect/global-protect-gateway/entry[ssl-tls-service-profile='{cert_name}' or .//certificate='{cert_name}']/@name")
-            usage['gateways'] = list(gateways)
-
-            # Search for management interface usage
-            mgmt_refs = root.xpath(f"//management/entry[.//certificate='{cert_name}']/@name")
-            if mgmt_refs:
-                usage['other'].extend([f"Management Interface: {ref}" for ref in mgmt_refs])
-
-            # Search for other references (generic search)
-            # This catches any other XML elements containing the cert name
-            other_refs = root.xpath(f"//*[text()='{cert_name}' and not(ancestor::certificate)]")
-            for ref in other_refs:
-                xpath = tree.getpath(ref)
-                # Filter out already found items
-                if not any(pattern in xpath for pattern in ['ssl-tls-service-profile', 'global-protect-portal', 'global-protect-gateway', 'management']):
-                    # Simplify XPath for readability
-                    simplified_xpath = xpath.split('/')[-3:] if len(xpath.split('/')) > 3 else xpath
-                    usage['other'].append('/'.join(simplified_xpath))
+            # Reuse the result of an earlier scan of the same, unchanged backup
+            cache_key = (config_file, os.stat(config_file).st_mtime_ns, cert_name)
+            cached = self._usage_cache.get(cache_key)
+
+            if cached:
+                logger.debug("Using cached analysis of unchanged config file")
+            else:
+                cached = self._scan_certificate_usage(config_file, cert_name)
+                self._usage_cache[cache_key] = cached
+
+            # Hand back copies so callers cannot alter the cached result
+            usage = {key: list(refs) for key, refs in cached.items()}
 
             # Calculate totals
             total_refs = sum(len(v) for v in usage.values())
 
             # Display results in formatted table
-            logger.info("-"*80)
+            logger.info(SUBBANNER)
             logger.info("SEARCH RESULTS")
-            logger.info("-"*80)
+            logger.info(SUBBANNER)
 
             if usage['ssl_tls_profiles']:
-                logger.info("\n📋 SSL/TLS Service Profiles:")
-                for i, profile in enumerate(usage['ssl_tls_profiles'], 1):
-                    logger.info(f"   {i}. {profile}")
+                logger.info("\n📋 SSL/TLS Service Profiles:" + "".join(
+                    f"\n   {i}. {profile}" for i, profile in enumerate(usage['ssl_tls_profiles'], 1)
+                ))
             else:
                 logger.info("\n📋 SSL/TLS Service Profiles: (none found)")
 
             if usage['portals']:
-                logger.info("\n🔐 GlobalProtect Portals:")
-                for i, portal in enumerate(usage['portals'], 1):
-                    logger.info(f"   {i}. {portal}")
+                logger.info("\n🔐 GlobalProtect Portals:" + "".join(
+                    f"\n   {i}. {portal}" for i, portal in enumerate(usage['portals'], 1)
+                ))
             else:
                 logger.info("\n🔐 GlobalProtect Portals: (none found)")
 
             if usage['gateways']:
-                logger.info("\n🚪 GlobalProtect Gateways:")
-                for i, gateway in enumerate(usage['gateways'], 1):
-                    logger.info(f"   {i}. {gateway}")
+                logger.info("\n🚪 GlobalProtect Gateways:" + "".join(
+                    f"\n   {i}. {gateway}" for i, gateway in enumerate(usage['gateways'], 1)
+                ))
             else:
                 logger.info("\n🚪 GlobalProtect Gateways: (none found)")
 
-            if usage['other']:
-                logger.info(f"\n🔍 Other References ({len(usage['other'])}):")
-                for i, ref in enumerate(usage['other'][:10], 1):  # Show first 10
-                    logger.info(f"   {i}. {ref}")
-                if len(usage['other']) > 10:
-                    logger.info(f"   ... and {len(usage['other']) - 10} more")
+            other_count = len(usage['other'])
+            if other_count:
+                logger.info(f"\n🔍 Other References ({other_count}):" + "".join(
+                    f"\n   {i}. {ref}" for i, ref in enumerate(islice(usage['other'], 10), 1)  # Show first 10
+                ))
+                if other_count > 10:
+                    logger.info(f"   ... and {other_count - 10} more")
 
-            logger.info("\n" + "-"*80)
+            logger.info("\n" + SUBBANNER)
             if total_refs == 0:
                 logger.warning("⚠️  NO REFERENCES FOUND")
                 logger.warning("   Certificate may not be in active use, or search patterns need adjustment")
@@ -477,13 +1025,13 @@ class PAFirewallClient:
                 logger.info(f"✓ TOTAL: {total_refs} reference(s) found")
                 logger.info("   These locations will need to be updated with the new certificate")
 
-            logger.info("="*80 + "\n")
+            logger.info(BANNER + "\n")
 
             return usage
 
         except Exception as e:
             logger.error(f"✗ Failed to search configuration: {e}")
-            logger.error("="*80 + "\n")
+            logger.error(BANNER + "\n")
             return usage
 
     def upload_certificate(self, cert_name: str, cert_file: str, key_file: str,
@@ -518,39 +1066,29 @@ class PAFirewallClient:
                 params['passphrase'] = passphrase
                 logger.info(f"  Using encrypted private key")
 
-            # Read certificate and key files
-            with open(cert_file, 'rb') as cf:
-                cert_content = cf.read()
-
-            with open(key_file, 'rb') as kf:
-                key_content = kf.read()
-
             # Combine certificate and private key into single PEM file
             # PAN-OS expects: certificate + private key in one file for keypair import
-            combined_pem = cert_content + b'\n' + key_content
-
-            logger.debug(f"   Certificate size: {len(cert_content)} bytes")
-            logger.debug(f"   Private key size: {len(key_content)} bytes")
-            logger.debug(f"   Combined PEM size: {len(combined_pem)} bytes")
+            # Both files are streamed from disk as the upload is sent
+            with open(cert_file, 'rb') as cf, open(key_file, 'rb') as kf:
+                combined_pem = _ConcatenatedStream([cf, b'\n', kf])
 
-            # Upload as single file
-            files = {
-                'file': ('certificate.pem', combined_pem, 'application/x-pem-file')
-            }
+                logger.debug(f"   Certificate size: {os.fstat(cf.fileno()).st_size} bytes")
+                logger.debug(f"   Private key size: {os.fstat(kf.fileno()).st_size} bytes")
+                logger.debug(f"   Combined PEM size: {len(combined_pem)} bytes")
 
-            # Make API call with POST and files
-            response = self._api_call(params, method='POST', files=files)
+                # Upload as single file
+                root = self._upload_pem(params, 'certificate.pem', combined_pem)
 
-            # Parse response
-            root = etree.fromstring(response.content)
             status = root.get('status')
 
             if status == 'success':
                 logger.info(f"✓ Certificate and private key uploaded successfully")
+                # Force the next verification to query the firewall
+                self._cert_exists_cache.pop(cert_name, None)
                 return True
             else:
-                error_msg = root.findtext('.//msg', default='Unknown error')
-                error_line = root.findtext('.//line', default='')
+                error_msg = _XP_MSG(root) or 'Unknown error'
+                error_line = _XP_LINE(root)
                 logger.error(f"✗ Certificate upload failed: {error_msg}")
                 if error_line:
                     logger.error(f"   Details: {error_line}")
@@ -564,57 +1102,60 @@ class PAFirewallClient:
             logger.debug(traceback.format_exc())
             return False
 
-    def verify_certificate_exists(self, cert_name: str, max_retries: int = 3, delay: int = 2) -> bool:
+    def verify_certificate_exists(self, cert_name: str, max_retries: int = 4, delay: float = 0.25) -> bool:
         """
         Verify that a certificate exists in the firewall configuration.
 
+        HTTP-level failures are already retried by the session's transport
+        adapter, so this only re-polls (with exponential backoff) while the
+        entry is not yet visible. Results are cached for CERT_EXISTS_TTL
+        seconds; uploading the certificate clears its cached result.
+
         Args:
             cert_name: Name of certificate to verify
-            max_retries: Maximum number of retry attempts
-            delay: Delay in seconds between retries
+            max_retries: Maximum number of re-checks while the entry is not visible
+            delay: Initial delay in seconds between checks (doubled on each retry)
 
         Returns:
             True if certificate exists, False otherwise
         """
-        import time
-
         logger.debug(f"Verifying certificate exists: {cert_name}")
 
-        for attempt in range(1, max_retries + 1):
+        cached = self._cert_exists_cache.get(cert_name)
+        if cached and time.monotonic() - cached[0] < self.CERT_EXISTS_TTL:
+            logger.debug(f"Using cached verification result for {cert_name}: {cached[1]}")
+            return cached[1]
+
+        for attempt in range(max_retries + 1):
             try:
                 # Query for the certificate in shared config
-                xpath = f"/config/shared/certificate/entry[@name='{cert_name}']"
+                xpath = f"/config/shared/certificate/entry[@name={xpath_literal(cert_name)}]"
                 params = {
                     'type': 'config',
                     'action': 'get',
                     'xpath': xpath
                 }
 
-                response = self._api_call(params)
-                root = etree.fromstring(response.content)
-                status = root.get('status')
+                # Retries must hit the firewall, not a cached miss
+                root = self._api_get_xml(params, use_cache=(attempt == 0))
 
-                if status == 'success':
-                    # Check if result contains the certificate entry
-                    result = root.find('.//entry')
-                    if result is not None and result.get('name') == cert_name:
-                        logger.debug(f"✓ Certificate verified in configuration (attempt {attempt}/{max_retries})")
-                        return True
+            except Exception as e:
+                logger.debug(f"Error verifying certificate: {e}")
+                return False
 
-                if attempt < max_retries:
-                    logger.debug(f"Certificate not yet visible, waiting {delay}s... (attempt {attempt}/{max_retries})")
-                    time.sleep(delay)
-                else:
-                    logger.warning(f"Certificate '{cert_name}' not found in configuration after {max_retries} attempts")
-                    return False
+            # Check if result contains the certificate entry
+            if root.get('status') == 'success' and _XP_ENTRY_BY_NAME(root, n=cert_name):
+                logger.debug(f"✓ Certificate verified in configuration (attempt {attempt + 1}/{max_retries + 1})")
+                self._cert_exists_cache[cert_name] = (time.monotonic(), True)
+                return True
 
-            except Exception as e:
-                logger.debug(f"Error verifying certificate (attempt {attempt}/{max_retries}): {e}")
-                if attempt < max_retries:
-                    time.sleep(delay)
-                else:
-                    return False
+            if attempt < max_retries:
+                wait = delay * (2 ** attempt)
+                logger.debug(f"Certificate not yet visible, waiting {wait}s... (attempt {attempt + 1}/{max_retries + 1})")
+                time.sleep(wait)
 
+        logger.warning(f"Certificate '{cert_name}' not found in configuration after {max_retries + 1} attempts")
+        self._cert_exists_cache[cert_name] = (time.monotonic(), False)
         return False
 
     def upload_certificate_chain(self, chain_name: str, chain_file: str) -> bool:
@@ -640,27 +1181,18 @@ class PAFirewallClient:
                 'format': 'pem'
             }
 
-            # Read chain file into memory
+            # Make API call, streaming the chain file from disk
             with open(chain_file, 'rb') as cf:
-                chain_content = cf.read()
-
-            # Prepare files dict with content in memory
-            files = {
-                'file': ('chain.pem', chain_content, 'application/x-pem-file')
-            }
-
-            # Make API call
-            response = self._api_call(params, method='POST', files=files)
+                root = self._upload_pem(params, 'chain.pem', cf)
 
-            # Parse response
-            root = etree.fromstring(response.content)
             status = root.get('status')
 
             if status == 'success':
                 logger.info(f"✓ Certificate chain uploaded successfully")
+                self._cert_exists_cache.pop(chain_name, None)
                 return True
             else:
-                error_msg = root.findtext('.//msg', default='Unknown error')
+                error_msg = _XP_MSG(root) or 'Unknown error'
                 logger.error(f"✗ Certificate chain upload failed: {error_msg}")
                 return False
 
@@ -684,10 +1216,10 @@ class PAFirewallClient:
 
         try:
             # XPath to the SSL/TLS profile
-            xpath = f"/config/shared/ssl-tls-service-profile/entry[@name='{profile_name}']"
+            xpath = f"/config/shared/ssl-tls-service-profile/entry[@name={xpath_literal(profile_name)}]"
 
             # XML element to update certificate
-            element = f"<certificate>{new_cert_name}</certificate>"
+            element = f"<certificate>{escape(new_cert_name)}</certificate>"
 
             params = {
                 'type': 'config',
@@ -696,24 +1228,27 @@ class PAFirewallClient:
                 'element': element
             }
 
-            response = self._api_call(params)
+            succeeded, response = self._api_call_status_only(params)
 
-            # Parse response
-            root = etree.fromstring(response.content)
-            status = root.get('status')
+            # Only build a tree when the response is not a plain success
+            if not succeeded:
+                root = etree.fromstring(response.content, _xml_parser())
+                status = root.get('status')
+                succeeded = status == 'success'
 
-            if status == 'success':
+            if succeeded:
                 logger.info(f"✓ SSL/TLS profile updated successfully")
                 return True
             else:
                 # Extract detailed error information
-                error_msg = root.findtext('.//msg', default='Unknown error')
-                error_line = root.findtext('.//line', default='')
-                error_details = root.findtext('.//details/line', default='')
+                error_msg = _XP_MSG(root) or 'Unknown error'
+                error_line = _XP_LINE(root)
+                error_details = _XP_DETAILS(root)
 
-                # Log the full response for debugging
-                logger.debug(f"API Response Status: {status}")
-                logger.debug(f"Full API Response:\n{response.content.decode('utf-8')}")
+                # Lazy formatting - the body is only decoded when debug logging is on
+                logger.debug("API Response Status: %s", status)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Full API Response:\n%s", response.content.decode('utf-8', errors='replace'))
 
                 logger.error(f"✗ SSL/TLS profile update failed: {error_msg}")
                 if error_line:
@@ -743,10 +1278,10 @@ class PAFirewallClient:
 
         try:
             # XPath to the GlobalProtect portal
-            xpath = f"/config/devices/entry[@name='localhost.localdomain']/vsys/entry[@name='vsys1']/global-protect/global-protect-portal/entry[@name='{portal_name}']"
+            xpath = f"{VSYS_XPATH}/global-protect/global-protect-portal/entry[@name={xpath_literal(portal_name)}]"
 
             # XML element to update certificate
-            element = f"<certificate>{new_cert_name}</certificate>"
+            element = f"<certificate>{escape(new_cert_name)}</certificate>"
 
             params = {
                 'type': 'config',
@@ -755,23 +1290,27 @@ class PAFirewallClient:
                 'element': element
             }
 
-            response = self._api_call(params)
+            succeeded, response = self._api_call_status_only(params)
 
-            # Parse response
-            root = etree.fromstring(response.content)
-            status = root.get('status')
+            # Only build a tree when the response is not a plain success
+            if not succeeded:
+                root = etree.fromstring(response.content, _xml_parser())
+                status = root.get('status')
+                succeeded = status == 'success'
 
-            if status == 'success':
+            if succeeded:
                 logger.info(f"✓ GlobalProtect portal updated successfully")
                 return True
             else:
                 # Extract detailed error information
-                error_msg = root.findtext('.//msg', default='Unknown error')
-                error_line = root.findtext('.//line', default='')
-                error_details = root.findtext('.//details/line', default='')
+                error_msg = _XP_MSG(root) or 'Unknown error'
+                error_line = _XP_LINE(root)
+                error_details = _XP_DETAILS(root)
 
-                logger.debug(f"API Response Status: {status}")
-                logger.debug(f"Full API Response:\n{response.content.decode('utf-8')}")
+                # Lazy formatting - the body is only decoded when debug logging is on
+                logger.debug("API Response Status: %s", status)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Full API Response:\n%s", response.content.decode('utf-8', errors='replace'))
 
                 logger.error(f"✗ GlobalProtect portal update failed: {error_msg}")
                 if error_line:
@@ -801,10 +1340,10 @@ class PAFirewallClient:
 
         try:
             # XPath to the GlobalProtect gateway
-            xpath = f"/config/devices/entry[@name='localhost.localdomain']/vsys/entry[@name='vsys1']/global-protect/global-protect-gateway/entry[@name='{gateway_name}']"
+            xpath = f"{VSYS_XPATH}/global-protect/global-protect-gateway/entry[@name={xpath_literal(gateway_name)}]"
 
             # XML element to update certificate
-            element = f"<certificate>{new_cert_name}</certificate>"
+            element = f"<certificate>{escape(new_cert_name)}</certificate>"
 
             params = {
                 'type': 'config',
@@ -813,23 +1352,27 @@ class PAFirewallClient:
                 'element': element
             }
 
-            response = self._api_call(params)
+            succeeded, response = self._api_call_status_only(params)
 
-            # Parse response
-            root = etree.fromstring(response.content)
-            status = root.get('status')
+            # Only build a tree when the response is not a plain success
+            if not succeeded:
+                root = etree.fromstring(response.content, _xml_parser())
+                status = root.get('status')
+                succeeded = status == 'success'
 
-            if status == 'success':
+            if succeeded:
                 logger.info(f"✓ GlobalProtect gateway updated successfully")
                 return True
             else:
                 # Extract detailed error information
-                error_msg = root.findtext('.//msg', default='Unknown error')
-                error_line = root.findtext('.//line', default='')
-                error_details = root.findtext('.//details/line', default='')
+                error_msg = _XP_MSG(root) or 'Unknown error'
+                error_line = _XP_LINE(root)
+                error_details = _XP_DETAILS(root)
 
-                logger.debug(f"API Response Status: {status}")
-                logger.debug(f"Full API Response:\n{response.content.decode('utf-8')}")
+                # Lazy formatting - the body is only decoded when debug logging is on
+                logger.debug("API Response Status: %s", status)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Full API Response:\n%s", response.content.decode('utf-8', errors='replace'))
 
                 logger.error(f"✗ GlobalProtect gateway update failed: {error_msg}")
                 if error_line:
@@ -843,6 +1386,99 @@ class PAFirewallClient:
             logger.debug(traceback.format_exc())
             return False
 
+    def update_all_references(self, usage: Dict[str, List[str]], new_cert_name: str) -> Dict[str, Dict[str, bool]]:
+        """
+        Update all SSL/TLS profiles, portals and gateways to the new certificate in one API call.
+
+        Builds a single config fragment covering every profile/portal/gateway found by
+        search_certificate_usage() and applies it with one set at /config. If the batched
+        set fails, falls back to the per-entry update methods, run concurrently.
+
+        Args:
+            usage: Usage locations from search_certificate_usage()
+            new_cert_name: Name of new certificate to use
+
+        Returns:
+            Dictionary per category ('ssl_tls_profiles', 'portals', 'gateways')
+            mapping each entry name to whether it was updated
+        """
+        targets = {key: usage.get(key, []) for key in ('ssl_tls_profiles', 'portals', 'gateways')}
+        total = sum(len(names) for names in targets.values())
+        results = {key: {} for key in targets}
+
+        if total == 0:
+            return results
+
+        logger.info(f"Updating {total} reference(s) to certificate {new_cert_name} in one batch...")
+
+        def add_entries(parent, names):
+            for name in names:
+                entry = etree.SubElement(parent, 'entry', name=name)
+                etree.SubElement(entry, 'certificate').text = new_cert_name
+
+        # Build <shared> and <devices> fragments mirroring the config layout
+        fragments = []
+        if targets['ssl_tls_profiles']:
+            shared = etree.Element('shared')
+            add_entries(etree.SubElement(shared, 'ssl-tls-service-profile'), targets['ssl_tls_profiles'])
+            fragments.append(shared)
+
+        if targets['portals'] or targets['gateways']:
+            devices = etree.Element('devices')
+            device = etree.SubElement(devices, 'entry', name=DEVICE_NAME)
+            vsys = etree.SubElement(etree.SubElement(device, 'vsys'), 'entry', name=VSYS_NAME)
+            global_protect = etree.SubElement(vsys, 'global-protect')
+            if targets['portals']:
+                add_entries(etree.SubElement(global_protect, 'global-protect-portal'), targets['portals'])
+            if targets['gateways']:
+                add_entries(etree.SubElement(global_protect, 'global-protect-gateway'), targets['gateways'])
+            fragments.append(devices)
+
+        element = ''.join(etree.tostring(fragment, encoding='unicode') for fragment in fragments)
+
+        try:
+            params = {
+                'type': 'config',
+                'action': 'set',
+                'xpath': '/config'
+            }
+
+            # Element goes in the POST body - it grows with the number of entries
+            response = self._api_call(params, method='POST', data={'element': element})
+            root = etree.fromstring(response.content, _xml_parser())
+
+            if root.get('status') == 'success':
+                logger.info(f"✓ Batch update successful ({total} reference(s))")
+                return {key: {name: True for name in names} for key, names in targets.items()}
+
+            error_msg = _XP_MSG(root) or 'Unknown error'
+            logger.warning(f"⚠ Batch update failed: {error_msg}")
+
+        except Exception as e:
+            logger.warning(f"⚠ Batch update failed: {e}")
+            logger.debug(traceback.format_exc())
+
+        # Fall back to updating each entry individually - every entry has its
+        # own xpath, so the updates run concurrently over the pooled session
+        logger.info("Falling back to per-entry updates...")
+        update_methods = {
+            'ssl_tls_profiles': self.update_ssl_tls_profile,
+            'portals': self.update_portal_certificate,
+            'gateways': self.update_gateway_certificate
+        }
+        with ThreadPoolExecutor(max_workers=min(self.UPDATE_WORKERS, total)) as executor:
+            futures = {
+                (key, name): executor.submit(update_methods[key], name, new_cert_name)
+                for key, names in targets.items()
+                for name in names
+            }
+
+        # Collected in submission order so the summaries stay deterministic
+        for (key, name), future in futures.items():
+            results[key][name] = future.result()
+
+        return results
+
 
 def select_certificate_to_replace(certificates: List[Dict[str, str]]) -> Optional[str]:
     """
@@ -858,17 +1494,16 @@ def select_certificate_to_replace(certificates: List[Dict[str, str]]) -> Optiona
         logger.error("No certificates available to select")
         return None
 
-    print("\n" + "="*80)
-    print("CERTIFICATES ON FIREWALL")
-    print("="*80)
-
-    for idx, cert in enumerate(certificates, 1):
-        print(f"\n{idx}. {cert['name']}")
-        print(f"   Common Name: {cert['common_name']}")
-        print(f"   Issuer: {cert['issuer']}")
-        print(f"   Expiry: {cert['expiry']}")
-
-    print("\n" + "="*80)
+    # Render the whole menu up front and write it in one go
+    menu = "".join(
+        f"\n{idx}. {cert['name']}"
+        f"\n   Common Name: {cert['common_name']}"
+        f"\n   Issuer: {cert['issuer']}"
+        f"\n   Expiry: {cert['expiry']}\n"
+        for idx, cert in enumerate(certificates, 1)
+    )
+    sys.stdout.write(f"\n{BANNER}\nCERTIFICATES ON FIREWALL\n{BANNER}\n{menu}\n{BANNER}\n")
+    sys.stdout.flush()
 
     while True:
         try:
@@ -915,31 +1550,43 @@ def setup_logging(verbose: bool = False, log_dir: str = DEFAULT_LOG_DIR):
     log_format = '%(asctime)s - %(levelname)s - %(message)s'
     date_format = '%Y-%m-%d %H:%M:%S'
 
-    # Setup handlers
-    handlers = [
-        logging.FileHandler(log_file),
-        logging.StreamHandler(sys.stdout)
-    ]
+    formatter = logging.Formatter(log_format, date_format)
+
+    # File writes happen on a background listener thread so logging calls
+    # never wait on disk I/O; stop() on exit drains the remaining records
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setFormatter(formatter)
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, file_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    # Records are fully formatted by file_handler, not when queued
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
+    # Console output stays synchronous so it keeps its order with the
+    # interactive certificate prompt
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(formatter)
 
     # Configure logging
     logging.basicConfig(
         level=log_level,
-        format=log_format,
-        datefmt=date_format,
-        handlers=handlers
+        handlers=[queue_handler, console_handler]
     )
 
-    logger.info("="*80)
+    logger.info(BANNER)
     logger.info("Palo Alto Firewall Certificate Update - Phase 1")
-    logger.info("="*80)
+    logger.info(BANNER)
     logger.info(f"Log file: {log_file}")
 
 
 def display_api_key_instructions():
     """Display instructions for obtaining API key from firewall."""
-    print("\n" + "="*80)
+    print("\n" + BANNER)
     print("HOW TO GET YOUR API KEY")
-    print("="*80)
+    print(BANNER)
     print("""
 To obtain your PAN-OS API key, use one of these methods:
 
@@ -962,7 +1609,7 @@ Copy the key value and use it with the --api-key argument.
 
 IMPORTANT: Store your API key securely and never commit it to version control!
 """)
-    print("="*80 + "\n")
+    print(BANNER + "\n")
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -1043,6 +1690,18 @@ Examples:
         help='Show what would be done without making changes'
     )
 
+    parser.add_argument(
+        '--gzip-upload',
+        action='store_true',
+        help='Gzip-compress certificate uploads (retries uncompressed if the firewall rejects it)'
+    )
+
+    parser.add_argument(
+        '--test-connection',
+        action='store_true',
+        help='Test the firewall connection before the backup (always done with --dry-run)'
+    )
+
     parser.add_argument(
         '--verbose',
         action='store_true',
@@ -1074,9 +1733,9 @@ def main():
     setup_logging(args.verbose, args.log_dir)
 
     # Display execution parameters
-    logger.info("\n" + "="*80)
+    logger.info("\n" + BANNER)
     logger.info("EXECUTION PARAMETERS")
-    logger.info("="*80)
+    logger.info(BANNER)
     logger.info(f"Target Firewall: {args.firewall}")
     logger.info(f"Backup Directory: {args.backup_dir}")
     logger.info(f"Log Directory: {args.log_dir}")
@@ -1095,54 +1754,73 @@ def main():
         logger.warning("🔍 DRY RUN MODE - No changes will be made to firewall")
     else:
         logger.info("⚡ LIVE MODE - Changes will be applied to firewall")
-    logger.info("="*80 + "\n")
+    logger.info(BANNER + "\n")
+
+    # Resolve input paths once for validation and the summaries below
+    cert_path = Path(args.cert_file)
+    key_path = Path(args.key_file)
+    chain_path = Path(args.chain_file) if args.chain_file else None
 
     # Validate certificate files exist
     logger.info("📂 Validating certificate files...")
-    for file_path, file_type in [(args.cert_file, 'Certificate'), (args.key_file, 'Key')]:
-        if not os.path.exists(file_path):
+    for file_path, file_type in [(cert_path, 'Certificate'), (key_path, 'Key')]:
+        if not file_path.is_file():
             logger.error(f"{file_type} file not found: {file_path}")
             sys.exit(1)
-        logger.info(f"   ✓ {file_type} file found: {Path(file_path).name}")
+        logger.info(f"   ✓ {file_type} file found: {file_path.name}")
 
-    if args.chain_file:
-        if not os.path.exists(args.chain_file):
-            logger.error(f"Chain file not found: {args.chain_file}")
+    if chain_path:
+        if not chain_path.is_file():
+            logger.error(f"Chain file not found: {chain_path}")
             sys.exit(1)
-        logger.info(f"   ✓ Chain file found: {Path(args.chain_file).name}")
+        logger.info(f"   ✓ Chain file found: {chain_path.name}")
     logger.info("")
 
     # Initialize firewall client
     # Note: SSL verification is disabled by default since firewalls typically use self-signed certs
     verify_ssl = False  # Always disable SSL verification for firewall management
-    client = PAFirewallClient(args.firewall, args.api_key, verify_ssl)
+    client = PAFirewallClient(args.firewall, args.api_key, verify_ssl, args.gzip_upload)
+    # Release pooled connections on every exit path
+    atexit.register(client.session.close)
 
     # PHASE 1: Backup and Discovery
-    logger.info("="*80)
+    logger.info(BANNER)
     logger.info("PHASE 1: BACKUP AND CERTIFICATE DISCOVERY")
-    logger.info("="*80 + "\n")
-
-    # Step 1: Test connection
-    logger.info("📡 Step 1/5: Testing firewall connection...")
-    if not client.test_connection():
-        logger.error("Failed to connect to firewall - exiting")
-        sys.exit(1)
+    logger.info(BANNER + "\n")
+
+    # Step 1: Test connection - live runs skip it by default since the backup
+    # request that follows fails just as loudly when the firewall is unreachable
+    if args.dry_run or args.test_connection:
+        logger.info("📡 Step 1/5: Testing firewall connection...")
+        if not client.test_connection():
+            logger.error("Failed to connect to firewall - exiting")
+            sys.exit(1)
+    else:
+        logger.info("📡 Step 1/5: Connection test skipped (checked by the backup request)")
     logger.info("")
 
-    # Step 2: Perform full backup (configuration + device state)
-    logger.info("💾 Step 2/5: Performing full firewall backup...")
-    backups = client.full_backup(args.backup_dir)
-    if not backups['config']:
-        logger.error("Failed to backup configuration - exiting for safety")
-        logger.error("Cannot proceed without configuration backup!")
-        sys.exit(1)
+    # The certificate list does not depend on the backup, so fetch it in the
+    # background while the exports download
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        certificates_future = executor.submit(client.list_certificates)
+
+        # Step 2: Perform full backup (configuration + device state)
+        logger.info("💾 Step 2/5: Performing full firewall backup...")
+        backups = client.full_backup(args.backup_dir)
+        if not backups['config']:
+            if not (args.dry_run or args.test_connection):
+                logger.error("Failed to connect to firewall or export its configuration")
+            logger.error("Failed to backup configuration - exiting for safety")
+            logger.error("Cannot proceed without configuration backup!")
+            sys.exit(1)
 
-    # Use config backup for certificate usage analysis
-    config_backup = backups['config']
+        # Use config backup for certificate usage analysis
+        config_backup = backups['config']
+
+        # Step 3: List certificates
+        logger.info("📜 Step 3/5: Retrieving certificate list...")
+        certificates = certificates_future.result()
 
-    # Step 3: List certificates
-    logger.info("📜 Step 3/5: Retrieving certificate list...")
-    certificates = client.list_certificates()
     if not certificates:
         logger.error("No certificates found on firewall")
         sys.exit(1)
@@ -1162,20 +1840,27 @@ def main():
     # ========================================================================
     # PHASE 1 COMPLETION SUMMARY
     # ========================================================================
-    logger.info("\n" + "="*80)
+    logger.info("\n" + BANNER)
     logger.info("PHASE 1 COMPLETION SUMMARY")
-    logger.info("="*80)
+    logger.info(BANNER)
 
-    # Count total references for display
-    total_refs = sum(len(v) for v in cert_usage.values())
+    # Count references once - reused by the summaries and the phase guards below
+    n_profiles, n_portals, n_gateways, n_other = map(len, (
+        cert_usage['ssl_tls_profiles'],
+        cert_usage['portals'],
+        cert_usage['gateways'],
+        cert_usage['other']
+    ))
+    total_refs = n_profiles + n_portals + n_gateways + n_other
 
     logger.info("\n✅ BACKUP STATUS:")
     logger.info(f"   • Configuration: {Path(config_backup).name}")
     logger.info(f"     Location: {config_backup}")
     if backups['device_state']:
-        logger.info(f"   • Device State: {Path(backups['device_state']).name}")
-        logger.info(f"     Location: {backups['device_state']}")
-        logger.info(f"     Size: {Path(backups['device_state']).stat().st_size / (1024*1024):.1f} MB")
+        device_state_path = Path(backups['device_state'])
+        logger.info(f"   • Device State: {device_state_path.name}")
+        logger.info(f"     Location: {device_state_path}")
+        logger.info(f"     Size: {device_state_path.stat().st_size / (1024*1024):.1f} MB")
     else:
         logger.info(f"   • Device State: ⚠️  Not backed up (non-critical)")
 
@@ -1186,23 +1871,23 @@ def main():
 
     if total_refs > 0:
         logger.info("\n🎯 LOCATIONS TO UPDATE:")
-        if cert_usage['ssl_tls_profiles']:
-            logger.info(f"   • SSL/TLS Profiles: {len(cert_usage['ssl_tls_profiles'])} profile(s)")
-        if cert_usage['portals']:
-            logger.info(f"   • GlobalProtect Portals: {len(cert_usage['portals'])} portal(s)")
-        if cert_usage['gateways']:
-            logger.info(f"   • GlobalProtect Gateways: {len(cert_usage['gateways'])} gateway(s)")
-        if cert_usage['other']:
-            logger.info(f"   • Other References: {len(cert_usage['other'])} location(s)")
-
-    logger.info("\n" + "="*80)
+        if n_profiles:
+            logger.info(f"   • SSL/TLS Profiles: {n_profiles} profile(s)")
+        if n_portals:
+            logger.info(f"   • GlobalProtect Portals: {n_portals} portal(s)")
+        if n_gateways:
+            logger.info(f"   • GlobalProtect Gateways: {n_gateways} gateway(s)")
+        if n_other:
+            logger.info(f"   • Other References: {n_other} location(s)")
+
+    logger.info("\n" + BANNER)
     if args.dry_run:
         logger.info("🔍 DRY RUN MODE")
-        logger.info("="*80)
+        logger.info(BANNER)
         logger.info("Phase 2 would perform the following actions:")
     else:
         logger.info("📋 NEXT STEPS - PHASE 2")
-        logger.info("="*80)
+        logger.info(BANNER)
         logger.info("Phase 2 will perform the following actions:")
 
     logger.info(f"\n1️⃣  Upload New Certificate")
@@ -1214,14 +1899,14 @@ def main():
 
     if total_refs > 0:
         logger.info(f"\n2️⃣  Update Configuration References")
-        if cert_usage['ssl_tls_profiles']:
-            logger.info(f"   • Update {len(cert_usage['ssl_tls_profiles'])} SSL/TLS profile(s)")
-        if cert_usage['portals']:
-            logger.info(f"   • Update {len(cert_usage['portals'])} GlobalProtect portal(s)")
-        if cert_usage['gateways']:
-            logger.info(f"   • Update {len(cert_usage['gateways'])} GlobalProtect gateway(s)")
-        if cert_usage['other']:
-            logger.info(f"   • Update {len(cert_usage['other'])} other reference(s)")
+        if n_profiles:
+            logger.info(f"   • Update {n_profiles} SSL/TLS profile(s)")
+        if n_portals:
+            logger.info(f"   • Update {n_portals} GlobalProtect portal(s)")
+        if n_gateways:
+            logger.info(f"   • Update {n_gateways} GlobalProtect gateway(s)")
+        if n_other:
+            logger.info(f"   • Update {n_other} other reference(s)")
     else:
         logger.info(f"\n⚠️  Note: No existing references found to update")
         logger.info(f"   New certificate will be uploaded but not automatically applied")
@@ -1233,19 +1918,19 @@ def main():
 
     # Exit if dry run
     if args.dry_run:
-        logger.info("\n" + "="*80)
+        logger.info("\n" + BANNER)
         logger.info("✓ DRY RUN COMPLETE")
-        logger.info("="*80)
+        logger.info(BANNER)
         logger.info("To execute Phase 2, run this command again without --dry-run")
-        logger.info("="*80 + "\n")
+        logger.info(BANNER + "\n")
         sys.exit(0)
 
     # ========================================================================
     # PHASE 2: CERTIFICATE UPLOAD AND CONFIGURATION UPDATE
     # ========================================================================
-    logger.info("\n" + "="*80)
+    logger.info("\n" + BANNER)
     logger.info("PHASE 2: CERTIFICATE UPLOAD AND CONFIGURATION UPDATE")
-    logger.info("="*80 + "\n")
+    logger.info(BANNER + "\n")
 
     phase2_success = True
     phase2_results = {
@@ -1298,31 +1983,40 @@ def main():
             logger.error("   This may indicate an import issue or permission problem.")
             phase2_success = False
 
-    # Step 3: Update SSL/TLS service profiles
-    if cert_usage['ssl_tls_profiles'] and phase2_success:
-        logger.info(f"🔧 Step 3/3: Updating SSL/TLS service profiles...")
-        logger.info(f"   Found {len(cert_usage['ssl_tls_profiles'])} profile(s) to update\n")
-
-        for profile_name in cert_usage['ssl_tls_profiles']:
-            profile_updated = client.update_ssl_tls_profile(profile_name, args.cert_name)
-
-            if profile_updated:
-                phase2_results['profiles_updated'].append(profile_name)
-            else:
-                phase2_results['profiles_failed'].append(profile_name)
-                phase2_success = False
-
-            logger.info("")  # Blank line between profiles
+    # Step 3: Update SSL/TLS profiles, portals and gateways in a single batched set
+    # (per-entry results are reported in the Phase 2 and Phase 3 summaries)
+    update_results = {'ssl_tls_profiles': {}, 'portals': {}, 'gateways': {}}
+    batch_refs = total_refs - n_other
+
+    if batch_refs > 0 and phase2_success:
+        logger.info(f"🔧 Step 3/3: Updating certificate references...")
+        logger.info(f"   Found {n_profiles} SSL/TLS profile(s), "
+                    f"{n_portals} portal(s), "
+                    f"{n_gateways} gateway(s) to update\n")
+        update_results = client.update_all_references(cert_usage, args.cert_name)
+        logger.info("")
+    elif batch_refs > 0:
+        logger.info("ℹ️  Step 3/3: Skipping certificate reference updates (earlier Phase 2 step failed)")
+        logger.info(f"   {n_profiles} SSL/TLS profile(s), "
+                    f"{n_portals} portal(s), "
+                    f"{n_gateways} gateway(s) left unchanged\n")
     else:
         logger.info("ℹ️  Step 3/3: No SSL/TLS profiles to update")
         logger.info("")
 
+    for profile_name, profile_updated in update_results['ssl_tls_profiles'].items():
+        if profile_updated:
+            phase2_results['profiles_updated'].append(profile_name)
+        else:
+            phase2_results['profiles_failed'].append(profile_name)
+            phase2_success = False
+
     # ========================================================================
     # PHASE 2 COMPLETION SUMMARY
     # ========================================================================
-    logger.info("="*80)
+    logger.info(BANNER)
     logger.info("PHASE 2 COMPLETION SUMMARY")
-    logger.info("="*80)
+    logger.info(BANNER)
 
     if phase2_success:
         logger.info("\n✅ STATUS: SUCCESS")
@@ -1332,34 +2026,30 @@ def main():
     logger.info("\n📤 CERTIFICATE UPLOAD:")
     if phase2_results['cert_uploaded']:
         logger.info(f"   ✓ Certificate: {args.cert_name}")
-        logger.info(f"     File: {Path(args.cert_file).name}")
+        logger.info(f"     File: {cert_path.name}")
     else:
         logger.info(f"   ✗ Certificate upload FAILED")
 
     if args.chain_file:
         if phase2_results['chain_uploaded']:
             logger.info(f"   ✓ Chain: {args.cert_name}-chain")
-            logger.info(f"     File: {Path(args.chain_file).name}")
+            logger.info(f"     File: {chain_path.name}")
         else:
             logger.info(f"   ⚠️  Chain upload failed (non-critical)")
 
     if phase2_results['profiles_updated'] or phase2_results['profiles_failed']:
-        logger.info("\n🔧 SSL/TLS PROFILES UPDATED:")
-        for profile in phase2_results['profiles_updated']:
-            logger.info(f"   ✓ {profile}")
+        logger.info("\n🔧 SSL/TLS PROFILES UPDATED:" + "".join(
+            f"\n   ✓ {profile}" for profile in phase2_results['profiles_updated']
+        ))
 
         if phase2_results['profiles_failed']:
-            logger.info("\n❌ SSL/TLS PROFILES FAILED:")
-            for profile in phase2_results['profiles_failed']:
-                logger.info(f"   ✗ {profile}")
+            logger.info("\n❌ SSL/TLS PROFILES FAILED:" + "".join(
+                f"\n   ✗ {profile}" for profile in phase2_results['profiles_failed']
+            ))
 
     # ========================================================================
     # PHASE 3: PORTAL & GATEWAY UPDATES
     # ========================================================================
-    logger.info("\n" + "="*80)
-    logger.info("PHASE 3: PORTAL & GATEWAY UPDATES")
-    logger.info("="*80 + "\n")
-
     phase3_success = True
     phase3_results = {
         'portals_updated': [],
@@ -1368,49 +2058,48 @@ def main():
         'gateways_failed': []
     }
 
-    if cert_usage['portals'] or cert_usage['gateways']:
-        # Update GlobalProtect portals
-        if cert_usage['portals'] and phase2_success:
-            logger.info(f"🔐 Step 1/2: Updating GlobalProtect portals...")
-            logger.info(f"   Found {len(cert_usage['portals'])} portal(s) to update\n")
+    # The whole phase, banners included, only runs when GlobalProtect uses the certificate
+    has_phase3 = bool(n_portals or n_gateways)
+
+    if has_phase3:
+        logger.info("\n" + BANNER)
+        logger.info("PHASE 3: PORTAL & GATEWAY UPDATES")
+        logger.info(BANNER + "\n")
 
-            for portal_name in cert_usage['portals']:
-                portal_updated = client.update_portal_certificate(portal_name, args.cert_name)
+        # GlobalProtect portals (updated by the Phase 2 batch)
+        if update_results['portals']:
+            logger.info(f"🔐 Step 1/2: Collecting GlobalProtect portal results...")
+            logger.info(f"   {len(update_results['portals'])} portal(s) processed in batch\n")
 
+            for portal_name, portal_updated in update_results['portals'].items():
                 if portal_updated:
                     phase3_results['portals_updated'].append(portal_name)
                 else:
                     phase3_results['portals_failed'].append(portal_name)
                     phase3_success = False
-
-                logger.info("")  # Blank line between portals
-        elif cert_usage['portals']:
+        elif n_portals:
             logger.info("ℹ️  Step 1/2: Skipping portal updates (Phase 2 had errors)")
             logger.info("")
 
-        # Update GlobalProtect gateways
-        if cert_usage['gateways'] and phase2_success:
-            logger.info(f"🚪 Step 2/2: Updating GlobalProtect gateways...")
-            logger.info(f"   Found {len(cert_usage['gateways'])} gateway(s) to update\n")
-
-            for gateway_name in cert_usage['gateways']:
-                gateway_updated = client.update_gateway_certificate(gateway_name, args.cert_name)
+        # GlobalProtect gateways (updated by the Phase 2 batch)
+        if update_results['gateways']:
+            logger.info(f"🚪 Step 2/2: Collecting GlobalProtect gateway results...")
+            logger.info(f"   {len(update_results['gateways'])} gateway(s) processed in batch\n")
 
+            for gateway_name, gateway_updated in update_results['gateways'].items():
                 if gateway_updated:
                     phase3_results['gateways_updated'].append(gateway_name)
                 else:
                     phase3_results['gateways_failed'].append(gateway_name)
                     phase3_success = False
-
-                logger.info("")  # Blank line between gateways
-        elif cert_usage['gateways']:
+        elif n_gateways:
             logger.info("ℹ️  Step 2/2: Skipping gateway updates (Phase 2 had errors)")
             logger.info("")
 
         # Phase 3 Summary
-        logger.info("="*80)
+        logger.info(BANNER)
         logger.info("PHASE 3 COMPLETION SUMMARY")
-        logger.info("="*80)
+        logger.info(BANNER)
 
         if phase3_success:
             logger.info("\n✅ STATUS: SUCCESS")
@@ -1418,34 +2107,33 @@ def main():
             logger.info("\n❌ STATUS: PARTIAL FAILURE")
 
         if phase3_results['portals_updated'] or phase3_results['portals_failed']:
-            logger.info("\n🔐 GLOBALPROTECT PORTALS UPDATED:")
-            for portal in phase3_results['portals_updated']:
-                logger.info(f"   ✓ {portal}")
+            logger.info("\n🔐 GLOBALPROTECT PORTALS UPDATED:" + "".join(
+                f"\n   ✓ {portal}" for portal in phase3_results['portals_updated']
+            ))
 
             if phase3_results['portals_failed']:
-                logger.info("\n❌ GLOBALPROTECT PORTALS FAILED:")
-                for portal in phase3_results['portals_failed']:
-                    logger.info(f"   ✗ {portal}")
+                logger.info("\n❌ GLOBALPROTECT PORTALS FAILED:" + "".join(
+                    f"\n   ✗ {portal}" for portal in phase3_results['portals_failed']
+                ))
 
         if phase3_results['gateways_updated'] or phase3_results['gateways_failed']:
-            logger.info("\n🚪 GLOBALPROTECT GATEWAYS UPDATED:")
-            for gateway in phase3_results['gateways_updated']:
-                logger.info(f"   ✓ {gateway}")
+            logger.info("\n🚪 GLOBALPROTECT GATEWAYS UPDATED:" + "".join(
+                f"\n   ✓ {gateway}" for gateway in phase3_results['gateways_updated']
+            ))
 
             if phase3_results['gateways_failed']:
-                logger.info("\n❌ GLOBALPROTECT GATEWAYS FAILED:")
-                for gateway in phase3_results['gateways_failed']:
-                    logger.info(f"   ✗ {gateway}")
+                logger.info("\n❌ GLOBALPROTECT GATEWAYS FAILED:" + "".join(
+                    f"\n   ✗ {gateway}" for gateway in phase3_results['gateways_failed']
+                ))
     else:
-        logger.info("ℹ️  No GlobalProtect portals or gateways found to update")
-        logger.info("✓ Phase 3 skipped - no portal/gateway configurations using this certificate")
+        logger.info("\nℹ️  Phase 3 skipped - no GlobalProtect portals or gateways use this certificate")
 
-    logger.info("\n" + "="*80)
+    logger.info("\n" + BANNER)
     logger.info("⚠️  IMPORTANT: Changes NOT yet committed!")
-    logger.info("="*80)
+    logger.info(BANNER)
     logger.info("Configuration changes are staged but not active.")
     logger.info("Phase 4 will validate and commit changes to make them active.")
-    logger.info("="*80 + "\n")
+    logger.info(BANNER + "\n")
 
     # Check overall success
     overall_success = phase2_success and phase3_success
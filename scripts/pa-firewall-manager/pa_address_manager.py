@@ -24,14 +24,18 @@ For full documentation, see README.md
 import argparse
 import csv
 import sys
+import re
 import requests
 import urllib3
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from typing import Dict, List, Optional, Tuple
 import logging
+from requests.adapters import HTTPAdapter
 from urllib.parse import urljoin
-
-# Disable SSL warnings for self-signed certificates (common with firewalls)
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+from urllib3.util.retry import Retry
+from xml.sax.saxutils import escape, quoteattr
 
 # Configure logging
 logging.basicConfig(
@@ -41,6 +45,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Characters not allowed in tag names (anything but letters, digits, '-', ':' and '.').
+# Underscores are already turned into hyphens before this is applied.
+_TAG_INVALID_CHARS = re.compile(r'[^\w\-:.]')
+
+# Single-pass character maps for tag and address object names
+_TAG_SEP_TRANS = str.maketrans({' ': '-', '_': '-'})
+_NAME_TRANS = str.maketrans({'.': '_', ' ': '_'})
+
 
 class PaloAltoAddressManager:
     """
@@ -63,8 +75,15 @@ class PaloAltoAddressManager:
         'Zone',
         'Namespace'
     ]
+    REQUIRED_COLUMNS_SET = frozenset(REQUIRED_COLUMNS)
+
+    # Default concurrent requests when creating tags and address objects
+    MAX_WORKERS = 20
+
+    # Entries per bulk XML API "set" when creating tags and address objects
+    BULK_CHUNK_SIZE = 200
 
-    def __init__(self, firewall_host: str, api_key: str, verify_ssl: bool = False, location: str = 'vsys', vsys: str = 'vsys1'):
+    def __init__(self, firewall_host: str, api_key: str, verify_ssl: bool = False, location: str = 'vsys', vsys: str = 'vsys1', max_workers: int = None):
         """
         Initialize the Palo Alto Address Manager using REST API.
 
@@ -74,12 +93,14 @@ class PaloAltoAddressManager:
             verify_ssl: Whether to verify SSL certificates (default: False for self-signed)
             location: Location type (vsys, device-group, etc.)
             vsys: Virtual system name (default: vsys1)
+            max_workers: Concurrent requests to the firewall (default: MAX_WORKERS)
         """
         self.firewall_host = firewall_host
         self.api_key = api_key
         self.verify_ssl = verify_ssl
         self.location = location
         self.vsys = vsys
+        self.max_workers = max_workers or self.MAX_WORKERS
 
         # REST API base URL
         self.base_url = f"https://{firewall_host}/restapi/v10.2"
@@ -90,10 +111,34 @@ class PaloAltoAddressManager:
             'Content-Type': 'application/json'
         }
 
+        # One pooled session for every call, so the TLS handshake with the
+        # firewall happens once per connection instead of once per request.
+        # The pool holds one connection per worker so threads never wait on it.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.verify = verify_ssl
+        if not verify_ssl:
+            # Disable SSL warnings for self-signed certificates (common with firewalls)
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers, max_retries=retry)
+        self.session.mount('https://', adapter)
+
+        # XML API calls (commit, bulk set) change the config - only retry a
+        # failed connect, never a timeout or 5xx that may already have queued
+        # a commit job. The longer prefix takes precedence over 'https://'
+        xml_retry = Retry(total=3, connect=3, read=0, status=0, other=0, backoff_factor=0.5)
+        xml_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers, max_retries=xml_retry)
+        self.session.mount(f"https://{firewall_host}/api/", xml_adapter)
+
+        # Existing tag/object names, filled by _prime_caches() (None = not loaded)
+        self._existing_tags = None
+        self._existing_objects = None
+
         logger.info(f"Initialized REST API connection to firewall: {firewall_host}")
         logger.info(f"Using location: {location}/{vsys}")
 
-    def _make_rest_request(self, method: str, endpoint: str, data: Dict = None, params: Dict = None) -> requests.Response:
+    def _make_rest_request(self, method: str, endpoint: str, data: Dict = None, params: Dict = None) -> Tuple[requests.Response, Optional[Dict]]:
         """
         Make a REST API request to the Palo Alto firewall.
 
@@ -104,61 +149,69 @@ class PaloAltoAddressManager:
             params: URL parameters
 
         Returns:
-            Response object from the API call
+            Tuple of (response, parsed JSON body or None if the body is empty or not JSON)
 
         Raises:
             requests.RequestException: If the API call fails
         """
         url = f"{self.base_url}{endpoint}"
 
-        try:
-            if method == 'GET':
-                response = requests.get(url, headers=self.headers, params=params, verify=self.verify_ssl, timeout=30)
-            elif method == 'POST':
-                # Use data= with json.dumps() like in the example (not json= parameter)
-                import json as json_module
-                body_str = json_module.dumps(data) if data else None
-                response = requests.post(url, headers=self.headers, data=body_str, params=params, verify=self.verify_ssl, timeout=30)
-            elif method == 'PUT':
-                import json as json_module
-                body_str = json_module.dumps(data) if data else None
-                response = requests.put(url, headers=self.headers, data=body_str, params=params, verify=self.verify_ssl, timeout=30)
-            elif method == 'DELETE':
-                response = requests.delete(url, headers=self.headers, params=params, verify=self.verify_ssl, timeout=30)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+        if method not in ('GET', 'POST', 'PUT', 'DELETE'):
+            raise ValueError(f"Unsupported HTTP method: {method}")
 
-            return response
+        try:
+            # requests serializes json= itself; Content-Type is already a session header
+            body = data if data and method in ('POST', 'PUT') else None
+            response = self.session.request(method, url, json=body, params=params, timeout=30)
         except requests.RequestException as e:
             logger.error(f"REST API request failed: {e}")
             raise
 
-    def test_connection(self) -> bool:
+        # Decode the body once here so callers never parse it twice
+        parsed = None
+        if response.content and 'json' in response.headers.get('Content-Type', ''):
+            try:
+                parsed = response.json()
+            except ValueError:
+                logger.debug(f"Invalid JSON in response from {endpoint}")
+
+        return response, parsed
+
+    def test_connection(self) -> Tuple[bool, Optional[set]]:
         """
         Test the connection to the firewall and validate the API key.
 
+        The test lists every address object, so the names are handed back for
+        the caller to pass on to process_csv_file() instead of fetching the
+        same list again.
+
         Returns:
-            True if connection is successful, False otherwise
+            Tuple of (connected: bool, address object names or None if unavailable)
         """
         try:
             # Try to list address objects as connection test
             endpoint = f"/Objects/Addresses"
             params = {'location': self.location, 'vsys': self.vsys}
 
-            response = self._make_rest_request('GET', endpoint, params=params)
+            response, parsed = self._make_rest_request('GET', endpoint, params=params)
 
             if response.status_code == 200:
                 logger.info("✓ Successfully connected to firewall (REST API)")
-                return True
+                names = None
+                if isinstance(parsed, dict):
+                    entries = self._result_entries(parsed)
+                    names = {entry['@name'] for entry in entries if '@name' in entry}
+                return True, names
             else:
                 logger.error(f"✗ Failed to connect: HTTP {response.status_code}")
                 logger.error(f"   Response: {response.text}")
-                return False
+                return False, None
         except Exception as e:
             logger.error(f"✗ Connection test failed: {e}")
-            return False
+            return False, None
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _sanitize_tag(tag: str) -> str:
         """
         Sanitize tag names to conform to Palo Alto requirements.
@@ -172,51 +225,105 @@ class PaloAltoAddressManager:
             Sanitized tag string
         """
         # Replace spaces and underscores with hyphens
-        sanitized = tag.replace(' ', '-').replace('_', '-')
+        sanitized = tag.translate(_TAG_SEP_TRANS)
         # Remove any other potentially problematic characters
-        sanitized = ''.join(c for c in sanitized if c.isalnum() or c in ['-', ':', '.'])
-        return sanitized
+        return _TAG_INVALID_CHARS.sub('', sanitized)
 
     def generate_tags(self, row: Dict, environment: str, cluster_name: str) -> List[str]:
         """
         Generate tags for an address object based on CSV data.
 
+        The tag rules themselves live in _generate_tags_cached() - change
+        tagging there so both this method and CSV processing pick it up.
+
         Args:
-            row: Dictionary containing CSV row data
+            row: Dictionary containing CSV row data (values already stripped)
             environment: Environment name (prod, dev, staging)
             cluster_name: Name of the GKE cluster
 
         Returns:
             List of tag strings (sanitized for Palo Alto compatibility)
         """
+        return list(self._row_tags(row, environment, cluster_name))
+
+    def _row_tags(self, row: Dict, environment: str, cluster_name: str) -> Tuple[str, ...]:
+        """
+        Return the shared, cached tag tuple for a row (see generate_tags).
+
+        process_csv_file() calls this for every row rather than
+        generate_tags(). A new CSV column used for tagging must be passed
+        from here to _generate_tags_cached().
+
+        Args:
+            row: Dictionary containing CSV row data (values already stripped)
+            environment: Environment name (prod, dev, staging)
+            cluster_name: Name of the GKE cluster
+
+        Returns:
+            Tuple of tag strings (sanitized for Palo Alto compatibility)
+        """
+        # Rows repeat the same few field combinations, so the tags are
+        # built once per (lowercased) combination and reused
+        return self._generate_tags_cached(
+            row.get('Type', '').lower(),
+            row.get('Namespace', 'N/A').lower(),
+            row.get('Zone', '').lower(),
+            row.get('Service_Name', '').lower(),
+            environment,
+            cluster_name
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _generate_tags_cached(
+        resource_type: str,
+        namespace: str,
+        zone: str,
+        service_name: str,
+        environment: str,
+        cluster_name: str
+    ) -> Tuple[str, ...]:
+        """
+        Build the sanitized tags for one combination of CSV field values.
+
+        This is where the tagging rules are defined.
+
+        Args:
+            resource_type: Lowercased 'Type' column value
+            namespace: Lowercased 'Namespace' column value
+            zone: Lowercased 'Zone' column value
+            service_name: Lowercased 'Service_Name' column value
+            environment: Environment name (prod, dev, staging)
+            cluster_name: Name of the GKE cluster
+
+        Returns:
+            Tuple of tag strings (sanitized for Palo Alto compatibility)
+        """
         tags = []
 
         # Environment tag
         tags.append(f"env:{environment}")
 
-        # Type tag (convert to lowercase and remove spaces)
-        resource_type = row.get('Type', '').lower().replace(' ', '')
+        # Type tag (remove spaces)
+        resource_type = resource_type.replace(' ', '')
         if resource_type:
             tags.append(f"type:{resource_type}")
 
         # Namespace tag
-        namespace = row.get('Namespace', 'N/A').lower()
         if namespace and namespace != 'n/a':
             tags.append(f"namespace:{namespace}")
         else:
             tags.append("namespace:none")
 
         # Zone tag
-        zone = row.get('Zone', '').lower()
         if zone:
             tags.append(f"zone:{zone}")
 
         # Service tag (extract from Service_Name)
-        service_name = row.get('Service_Name', '').lower()
         if service_name:
             # Extract the primary service (e.g., "adguard" from "adguard-web")
             # Remove spaces and special characters for valid tag format
-            service = service_name.split('-')[0].replace(' ', '-').replace('_', '-')
+            service = service_name.split('-')[0].translate(_TAG_SEP_TRANS)
             tags.append(f"service:{service}")
 
         # Cluster tag
@@ -227,9 +334,73 @@ class PaloAltoAddressManager:
         tags.append("auto-created")
 
         # Sanitize all tags to remove spaces and invalid characters
-        tags = [self._sanitize_tag(tag) for tag in tags]
+        return tuple(PaloAltoAddressManager._sanitize_tag(tag) for tag in tags)
+
+    @staticmethod
+    def _result_entries(data: Dict) -> List[Dict]:
+        """
+        Extract the entry list from a REST API GET response.
+
+        Args:
+            data: Parsed JSON response body
 
-        return tags
+        Returns:
+            List of entry dicts (a single entry is wrapped in a list)
+        """
+        entries = data.get('result', {}).get('entry', [])
+        if isinstance(entries, dict):
+            return [entries]
+        return entries if isinstance(entries, list) else []
+
+    def _list_names(self, endpoint: str) -> Optional[set]:
+        """
+        List the names of all entries under a REST collection in one GET.
+
+        Args:
+            endpoint: REST collection endpoint (e.g., /Objects/Tags)
+
+        Returns:
+            Set of entry names, or None if the listing failed
+        """
+        params = {
+            'location': self.location,
+            'vsys': self.vsys
+        }
+
+        try:
+            response, parsed = self._make_rest_request('GET', endpoint, params=params)
+            if response.status_code != 200 or not isinstance(parsed, dict):
+                logger.debug(f"Listing {endpoint} failed: HTTP {response.status_code}")
+                return None
+
+            entries = self._result_entries(parsed)
+            return {entry['@name'] for entry in entries if '@name' in entry}
+        except Exception as e:
+            logger.debug(f"Listing {endpoint} failed: {e}")
+            return None
+
+    def _prime_caches(self, existing_objects: Optional[set] = None):
+        """
+        Load all existing tag and address object names with one GET each.
+
+        Once loaded, check_tag_exists() / check_object_exists() answer from
+        memory instead of issuing a GET per item. If a listing fails, that
+        check keeps using the per-item GET.
+
+        Args:
+            existing_objects: Address object names already listed (e.g. by
+                test_connection()); the address listing is skipped if given
+        """
+        self._existing_tags = self._list_names("/Objects/Tags")
+        if existing_objects is not None:
+            self._existing_objects = set(existing_objects)
+        else:
+            self._existing_objects = self._list_names("/Objects/Addresses")
+
+        if self._existing_tags is not None:
+            logger.info(f"Found {len(self._existing_tags)} existing tags on firewall")
+        if self._existing_objects is not None:
+            logger.info(f"Found {len(self._existing_objects)} existing address objects on firewall")
 
     def check_tag_exists(self, tag_name: str) -> bool:
         """
@@ -241,6 +412,9 @@ class PaloAltoAddressManager:
         Returns:
             True if tag exists, False otherwise
         """
+        if self._existing_tags is not None:
+            return tag_name in self._existing_tags
+
         try:
             endpoint = f"/Objects/Tags"
             params = {
@@ -249,11 +423,11 @@ class PaloAltoAddressManager:
                 'name': tag_name
             }
 
-            response = self._make_rest_request('GET', endpoint, params=params)
+            response, parsed = self._make_rest_request('GET', endpoint, params=params)
 
-            if response.status_code == 200:
-                data = response.json()
-                return '@name' in str(data) and tag_name in str(data)
+            if response.status_code == 200 and isinstance(parsed, dict):
+                entries = self._result_entries(parsed)
+                return any(entry.get('@name') == tag_name for entry in entries)
 
             return False
         except:
@@ -300,16 +474,17 @@ class PaloAltoAddressManager:
 
         try:
             # POST to create new tag
-            response = self._make_rest_request('POST', endpoint, data=body, params=params)
+            response, parsed = self._make_rest_request('POST', endpoint, data=body, params=params)
 
             if response.status_code in [200, 201]:
                 logger.info(f"✓ Created tag: {tag_name}")
+                if self._existing_tags is not None:
+                    self._existing_tags.add(tag_name)
                 return True, "Success"
             elif response.status_code == 400:
-                try:
-                    response_data = response.json() if response.text else {}
-                    error_message = response_data.get('message', response.text)
-                except:
+                if isinstance(parsed, dict):
+                    error_message = parsed.get('message', response.text)
+                else:
                     error_message = response.text
 
                 if 'already exists' in error_message.lower():
@@ -329,6 +504,72 @@ class PaloAltoAddressManager:
             logger.warning(f"⚠ {error_msg}")
             return False, error_msg
 
+    def _config_xpath(self, kind: str) -> Optional[str]:
+        """
+        Build the XML API config XPath for an object container.
+
+        Args:
+            kind: Container name under the location (e.g., 'tag', 'address')
+
+        Returns:
+            XPath string, or None if bulk create is not supported for the location
+        """
+        if self.location == 'vsys':
+            return f"/config/devices/entry[@name='localhost.localdomain']/vsys/entry[@name='{self.vsys}']/{kind}"
+        if self.location == 'shared':
+            return f"/config/shared/{kind}"
+        return None
+
+    def _bulk_set(self, xpath: str, elements: List[str]) -> Tuple[bool, str]:
+        """
+        Create several entries in one XML API config "set" call.
+
+        The REST API only accepts one named entry per POST, while the XML API
+        "set" action takes any number of <entry> elements under a container.
+        The call is all-or-nothing: if one entry is rejected, none are created.
+
+        Args:
+            xpath: Container XPath (see _config_xpath)
+            elements: Serialized <entry> elements
+
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        xml_url = f"https://{self.firewall_host}/api/"
+        form = {
+            'type': 'config',
+            'action': 'set',
+            'xpath': xpath,
+            'element': ''.join(elements),
+            'key': self.api_key
+        }
+
+        try:
+            # Send as a form body - a few hundred entries is too long for a URL
+            response = self.session.post(
+                xml_url,
+                data=form,
+                headers={'Content-Type': 'application/x-www-form-urlencoded'},
+                timeout=60
+            )
+
+            if response.status_code == 200 and 'status="success"' in response.text:
+                return True, "Success"
+            return False, f"HTTP {response.status_code} - {response.text}"
+
+        except Exception as e:
+            return False, str(e)
+
+    @staticmethod
+    def _chunks(items: List, size: int):
+        """Yield successive lists of at most size items."""
+        iterator = iter(items)
+        while True:
+            chunk = list(islice(iterator, size))
+            if not chunk:
+                return
+            yield chunk
+
     def create_tags_batch(self, tags: List[str]) -> Dict[str, int]:
         """
         Create multiple tags in batch.
@@ -344,9 +585,34 @@ class PaloAltoAddressManager:
 
         logger.info(f"Checking/creating {len(unique_tags)} unique tags...")
 
-        for tag in unique_tags:
-            success, message = self.create_tag(tag)
+        # With the existing names loaded, create the missing tags in bulk
+        xpath = self._config_xpath('tag')
+        if self._existing_tags is not None and xpath:
+            missing = [t for t in unique_tags if t not in self._existing_tags]
+            stats['skipped'] = len(unique_tags) - len(missing)
+            for tag_name in unique_tags:
+                if tag_name in self._existing_tags:
+                    logger.debug(f"Tag '{tag_name}' already exists, skipping creation")
+
+            leftover = []
+            for chunk in self._chunks(missing, self.BULK_CHUNK_SIZE):
+                elements = [f"<entry name={quoteattr(t)}/>" for t in chunk]
+                success, message = self._bulk_set(xpath, elements)
+                if success:
+                    for tag_name in chunk:
+                        logger.info(f"✓ Created tag: {tag_name}")
+                        self._existing_tags.add(tag_name)
+                    stats['created'] += len(chunk)
+                else:
+                    logger.warning(f"⚠ Bulk tag create failed, retrying {len(chunk)} tags one by one: {message}")
+                    leftover.extend(chunk)
+            unique_tags = leftover
+
+        # Each tag is independent - create them concurrently (results stay in order)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(self.create_tag, unique_tags))
 
+        for success, message in results:
             if success:
                 if 'already exists' in message.lower():
                     stats['skipped'] += 1
@@ -367,6 +633,9 @@ class PaloAltoAddressManager:
         Returns:
             True if object exists, False otherwise
         """
+        if self._existing_objects is not None:
+            return name in self._existing_objects
+
         try:
             endpoint = f"/Objects/Addresses"
             params = {
@@ -375,12 +644,12 @@ class PaloAltoAddressManager:
                 'name': name
             }
 
-            response = self._make_rest_request('GET', endpoint, params=params)
+            response, parsed = self._make_rest_request('GET', endpoint, params=params)
 
             # If status is 200 and we get data, object exists
-            if response.status_code == 200:
-                data = response.json()
-                return '@name' in str(data) and name in str(data)
+            if response.status_code == 200 and isinstance(parsed, dict):
+                entries = self._result_entries(parsed)
+                return any(entry.get('@name') == name for entry in entries)
 
             return False
         except:
@@ -449,16 +718,17 @@ class PaloAltoAddressManager:
             logger.debug(f"Body: {body}")
 
             # POST to create new address object
-            response = self._make_rest_request('POST', endpoint, data=body, params=params)
+            response, parsed = self._make_rest_request('POST', endpoint, data=body, params=params)
 
             if response.status_code in [200, 201]:
                 logger.info(f"✓ Created address object: {name} ({ip_address})")
+                if self._existing_objects is not None:
+                    self._existing_objects.add(name)
                 return True, "Success"
             elif response.status_code == 400:
-                try:
-                    response_data = response.json() if response.text else {}
-                    error_message = response_data.get('message', response.text)
-                except:
+                if isinstance(parsed, dict):
+                    error_message = parsed.get('message', response.text)
+                else:
                     error_message = response.text
 
                 if 'already exists' in error_message.lower():
@@ -479,10 +749,98 @@ class PaloAltoAddressManager:
             logger.error(f"✗ {error_msg}")
             return False, error_msg
 
-    def commit_changes(self) -> Tuple[bool, str]:
+    def create_address_objects_batch(self, objects: List[Dict]) -> Dict[str, int]:
+        """
+        Create multiple address objects in batch.
+
+        Objects already on the firewall are skipped. The rest are created
+        BULK_CHUNK_SIZE at a time with one XML API call per chunk; a chunk
+        that fails is retried one object at a time over REST so a single bad
+        entry doesn't block the others.
+
+        Args:
+            objects: List of dicts with name, ip_address, description and tags
+
+        Returns:
+            Dictionary with statistics (created, failed, skipped)
+        """
+        stats = {'created': 0, 'failed': 0, 'skipped': 0}
+        leftover = objects
+
+        xpath = self._config_xpath('address')
+        if self._existing_objects is not None and xpath:
+            leftover = []
+            missing = []
+            seen = set()
+            for obj in objects:
+                if obj['name'] in self._existing_objects or obj['name'] in seen:
+                    logger.warning(f"⊘ Skipping {obj['name']} - already exists")
+                    stats['skipped'] += 1
+                else:
+                    seen.add(obj['name'])
+                    missing.append(obj)
+
+            for chunk in self._chunks(missing, self.BULK_CHUNK_SIZE):
+                elements = [self._address_entry_xml(**obj) for obj in chunk]
+                success, message = self._bulk_set(xpath, elements)
+                if success:
+                    for obj in chunk:
+                        logger.info(f"✓ Created address object: {obj['name']} ({obj['ip_address']})")
+                        self._existing_objects.add(obj['name'])
+                    stats['created'] += len(chunk)
+                else:
+                    logger.warning(f"⚠ Bulk create failed, retrying {len(chunk)} objects one by one: {message}")
+                    leftover.extend(chunk)
+
+        # Address objects are independent - create them concurrently
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(lambda obj: self.create_address_object(**obj), leftover))
+
+        for success, message in results:
+            if success:
+                if 'skip' in message.lower() or 'already exists' in message.lower():
+                    stats['skipped'] += 1
+                else:
+                    stats['created'] += 1
+            else:
+                stats['failed'] += 1
+
+        return stats
+
+    @staticmethod
+    def _address_entry_xml(name: str, ip_address: str, description: str, tags: List[str]) -> str:
+        """
+        Serialize an address object as an XML API <entry> element.
+
+        Args:
+            name: Name of the address object
+            ip_address: IP address, with or without CIDR suffix
+            description: Description of the address object
+            tags: List of tags to apply
+
+        Returns:
+            The <entry> element as a string
+        """
+        if '/' not in ip_address:
+            ip_address = f"{ip_address}/32"
+
+        parts = [f"<entry name={quoteattr(name)}><ip-netmask>{escape(ip_address)}</ip-netmask>"]
+        if description and description.strip():
+            parts.append(f"<description>{escape(description)}</description>")
+        if tags:
+            members = ''.join(f"<member>{escape(t)}</member>" for t in tags)
+            parts.append(f"<tag>{members}</tag>")
+        parts.append("</entry>")
+        return ''.join(parts)
+
+    def commit_changes(self, admin_user: str = None) -> Tuple[bool, str]:
         """
         Commit pending changes to the firewall configuration using REST API.
 
+        Args:
+            admin_user: If given, commit only this admin's changes (partial
+                commit) instead of everything pending on the firewall
+
         Returns:
             Tuple of (success: bool, message: str)
         """
@@ -495,13 +853,19 @@ class PaloAltoAddressManager:
         try:
             # Use old XML API for commit (REST API commit is more complex)
             xml_url = f"https://{self.firewall_host}/api/"
+            if admin_user:
+                # Partial commit only validates and applies this admin's changes
+                cmd = f"<commit><partial><admin><member>{escape(admin_user)}</member></admin></partial></commit>"
+                logger.info(f"Partial commit scoped to admin: {admin_user}")
+            else:
+                cmd = '<commit></commit>'
             params = {
                 'type': 'commit',
-                'cmd': '<commit></commit>',
+                'cmd': cmd,
                 'key': self.api_key
             }
 
-            response = requests.get(xml_url, params=params, verify=self.verify_ssl, timeout=60)
+            response = self.session.get(xml_url, params=params, timeout=60)
 
             if 'success' in response.text or response.status_code == 200:
                 logger.info("✓ Successfully committed changes")
@@ -523,9 +887,11 @@ class PaloAltoAddressManager:
         cluster_name: str = 'us-central1-prod',
         dry_run: bool = False,
         commit: bool = True,
+        admin_user: str = None,
         test_one: bool = False,
         tags_only: bool = False,
-        objects_only: bool = False
+        objects_only: bool = False,
+        existing_objects: Optional[set] = None
     ) -> Dict[str, int]:
         """
         Process a CSV file and create address objects for each row.
@@ -536,9 +902,12 @@ class PaloAltoAddressManager:
             cluster_name: Cluster name for tagging (default: 'us-central1-prod')
             dry_run: If True, only validate without creating objects
             commit: If True, commit changes after creation
+            admin_user: If given, commit only this admin's changes (partial commit)
             test_one: If True, only process first CSV row (for testing)
             tags_only: If True, only create tags (skip address objects)
             objects_only: If True, skip tag creation (assumes tags exist)
+            existing_objects: Address object names already listed (e.g. by
+                test_connection()), used instead of listing them again
 
         Returns:
             Dictionary with statistics (created, failed, skipped)
@@ -547,16 +916,22 @@ class PaloAltoAddressManager:
 
         try:
             with open(csv_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
+                # Plain reader + column indices - no dict built per row
+                reader = csv.reader(f)
+                header = next(reader, [])
 
                 # Validate CSV columns
-                if not all(col in reader.fieldnames for col in self.REQUIRED_COLUMNS):
-                    missing = set(self.REQUIRED_COLUMNS) - set(reader.fieldnames)
+                missing = self.REQUIRED_COLUMNS_SET.difference(header)
+                if missing:
+                    missing = [col for col in self.REQUIRED_COLUMNS if col in missing]
                     logger.error(f"CSV missing required columns: {missing}")
-                    logger.error(f"Found columns: {reader.fieldnames}")
+                    logger.error(f"Found columns: {header}")
                     logger.error(f"Required columns: {self.REQUIRED_COLUMNS}")
                     sys.exit(1)
 
+                idx = {col: header.index(col) for col in self.REQUIRED_COLUMNS}
+                width = len(header)
+
                 logger.info(f"Processing CSV file: {csv_file}")
 
                 # Show mode
@@ -569,31 +944,51 @@ class PaloAltoAddressManager:
                 elif objects_only:
                     logger.info("📦 OBJECTS ONLY MODE - Skipping tag creation")
 
-                # First pass: Collect all unique tags from all rows
+                # Single pass: collect unique tags and build every object from the CSV
                 logger.info("")
                 logger.info("Phase 1: Collecting tags from CSV...")
-                all_tags = set()
-                rows_data = []  # Store row data for second pass
+                tag_tuples = set()  # distinct tag combinations; most rows share one
+                rows_data = []  # (row_num, object) pairs for Phase 3
 
                 for row_num, row in enumerate(reader, start=2):
-                    ip_address = row.get('IP_Address', '').strip()
-                    hostname = row.get('Hostname', '').strip()
+                    # Skip blank lines and pad short rows with empty values
+                    if not row:
+                        continue
+                    if len(row) < width:
+                        row += [''] * (width - len(row))
+
+                    # Normalize the row once; everything below reads nrow
+                    nrow = {col: row[i].strip() for col, i in idx.items()}
+                    ip_address = nrow['IP_Address']
+                    hostname = nrow['Hostname']
+                    function = nrow['Function']
 
                     # Skip rows with missing critical data
                     if not ip_address or not hostname:
                         continue
 
                     # Generate tags for this row
-                    tags = self.generate_tags(row, environment, cluster_name)
-                    all_tags.update(tags)
+                    tags = self._row_tags(nrow, environment, cluster_name)
+                    tag_tuples.add(tags)
 
-                    # Store row data for processing
-                    rows_data.append((row_num, row))
+                    # Generate object name (use hostname, sanitized for firewall naming)
+                    object_name = hostname.translate(_NAME_TRANS)
+
+                    # Generate description
+                    description = f"{function} - {ip_address}"
+
+                    rows_data.append((row_num, {
+                        'name': object_name,
+                        'ip_address': ip_address,
+                        'description': description,
+                        'tags': list(tags)
+                    }))
 
                     # If test_one mode, stop after first row
                     if test_one:
                         break
 
+                all_tags = set().union(*tag_tuples)
                 logger.info(f"Found {len(all_tags)} unique tags across {len(rows_data)} valid objects")
 
                 # Show which tags cover all GKE resources
@@ -602,6 +997,11 @@ class PaloAltoAddressManager:
                 if cluster_tags:
                     logger.info(f"🏷️  Tags covering ALL GKE resources: {', '.join(cluster_tags + auto_tags)}")
 
+                # Load existing names once instead of a GET per tag/object
+                if not dry_run:
+                    logger.info("")
+                    self._prime_caches(existing_objects)
+
                 # Create all tags before creating address objects
                 if not dry_run and not objects_only and all_tags:
                     logger.info("")
@@ -620,52 +1020,29 @@ class PaloAltoAddressManager:
                     logger.info("")
                     logger.info("📦 Objects-only mode: Skipping tag creation (assuming tags exist)")
 
-                # Second pass: Create address objects
+                # Create address objects
                 if not tags_only:
                     logger.info("")
                     logger.info("Phase 3: Creating address objects...")
 
-                for row_num, row in rows_data:
-                    ip_address = row.get('IP_Address', '').strip()
-                    hostname = row.get('Hostname', '').strip()
-                    function = row.get('Function', '').strip()
-
-                    # Generate object name (use hostname, sanitized for firewall naming)
-                    object_name = hostname.replace('.', '_').replace(' ', '_')
-
-                    # Generate description
-                    description = f"{function} - {ip_address}"
+                for row_num, obj in rows_data:
+                    logger.info(f"Row {row_num}: {obj['name']} ({obj['ip_address']})")
+                    logger.info(f"  Description: {obj['description']}")
+                    logger.info(f"  Tags: {', '.join(obj['tags'])}")
 
-                    # Generate tags
-                    tags = self.generate_tags(row, environment, cluster_name)
-
-                    logger.info(f"Row {row_num}: {object_name} ({ip_address})")
-                    logger.info(f"  Description: {description}")
-                    logger.info(f"  Tags: {', '.join(tags)}")
-
-                    if not dry_run:
-                        success, message = self.create_address_object(
-                            name=object_name,
-                            ip_address=ip_address,
-                            description=description,
-                            tags=tags
-                        )
-
-                        if success:
-                            if 'skip' in message.lower() or 'already exists' in message.lower():
-                                stats['skipped'] += 1
-                            else:
-                                stats['created'] += 1
-                        else:
-                            stats['failed'] += 1
-                    else:
+                    if dry_run:
                         logger.info("  [DRY RUN] Would create this object")
                         stats['created'] += 1
 
+                if not dry_run and rows_data:
+                    object_stats = self.create_address_objects_batch([obj for _, obj in rows_data])
+                    for key in stats:
+                        stats[key] += object_stats[key]
+
                 # Commit changes if requested and not dry run
                 if commit and not dry_run and stats['created'] > 0:
                     logger.info("")
-                    self.commit_changes()
+                    self.commit_changes(admin_user=admin_user)
 
         except FileNotFoundError:
             logger.error(f"CSV file not found: {csv_file}")
@@ -889,12 +1266,24 @@ Examples:
         help='Create objects but do not commit changes (requires manual commit)'
     )
 
+    parser.add_argument(
+        '--admin-user',
+        help='Commit only changes made by this admin (partial commit; default: commit all)'
+    )
+
     parser.add_argument(
         '--verify-ssl',
         action='store_true',
         help='Verify SSL certificates (default: disabled for self-signed certs)'
     )
 
+    parser.add_argument(
+        '--max-workers',
+        type=int,
+        default=PaloAltoAddressManager.MAX_WORKERS,
+        help=f'Concurrent requests to the firewall (default: {PaloAltoAddressManager.MAX_WORKERS})'
+    )
+
     parser.add_argument(
         '--verbose',
         action='store_true',
@@ -938,6 +1327,9 @@ Examples:
     if mode_count > 1:
         parser.error("Cannot use --test-one, --tags-only, and --objects-only together. Choose one.")
 
+    if args.max_workers < 1:
+        parser.error("--max-workers must be at least 1")
+
     if args.dry_run and (args.tags_only or args.objects_only or args.test_one):
         parser.error("--dry-run cannot be used with --test-one, --tags-only, or --objects-only")
 
@@ -955,11 +1347,13 @@ Examples:
     manager = PaloAltoAddressManager(
         firewall_host=args.firewall,
         api_key=args.api_key,
-        verify_ssl=args.verify_ssl
+        verify_ssl=args.verify_ssl,
+        max_workers=args.max_workers
     )
 
-    # Test connection
-    if not manager.test_connection():
+    # Test connection (also lists existing address objects)
+    connected, existing_objects = manager.test_connection()
+    if not connected:
         logger.error("Failed to connect to firewall. Check API key and connectivity.")
         sys.exit(1)
 
@@ -972,9 +1366,11 @@ Examples:
         cluster_name=args.cluster,
         dry_run=args.dry_run,
         commit=not args.no_commit,
+        admin_user=args.admin_user,
         test_one=args.test_one,
         tags_only=args.tags_only,
-        objects_only=args.objects_only
+        objects_only=args.objects_only,
+        existing_objects=existing_objects
     )
 
     # Print summary